@@ -31,11 +31,16 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
+# The log format above doesn't use thread or process information, so skip
+# collecting it for every log record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
 # Get a logger for the package
 logger = logging.getLogger(__name__)
-logger.info(f"Initializing Jupiter SCADA v{__version__}")
-logger.debug(f"Logging level set to '{LOG_LEVEL}'")
+logger.info("Initializing Jupiter SCADA v%s", __version__)
+logger.debug("Logging level set to '%s'", LOG_LEVEL)
 
 
 # --- Public API Exports (optional) ---
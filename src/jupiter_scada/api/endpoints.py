@@ -3,20 +3,23 @@
 Defines the REST API endpoints for the Jupiter SCADA application.
 
 This module uses FastAPI's APIRouter to create routes for accessing
-OPC UA tag data. The endpoints interact with the singleton OpcuaClient
+OPC UA tag data. The endpoints interact with the application's OpcuaClient
 instance to retrieve real-time or cached data.
 """
 
+import asyncio
 import logging
-from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Literal, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.requests import HTTPConnection
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 # This import assumes the OpcuaClient class is defined in this location.
 # It's a relative import because this module is part of the 'api' package.
-from ..opcua.client import OpcuaClient
+from ..opcua.client import JSON_OPTIONS, RESYNC_REQUIRED, OpcuaClient, json_default
 
 # --- Pydantic Models for API Responses ---
 
@@ -26,12 +29,19 @@ class TagData(BaseModel):
     Represents the data for a single OPC UA tag.
     """
     value: Any = Field(..., description="The current value of the tag.")
-    source_timestamp: datetime | None = Field(
-        ..., description="The timestamp from the source (OPC UA Server)."
+    source_timestamp: int | None = Field(
+        ...,
+        description=(
+            "The timestamp from the source (OPC UA Server), in milliseconds since the Unix epoch. "
+            "For monitored tags whose server reports none, the time the value was received."
+        ),
     )
-    server_timestamp: datetime | None = Field(
+    server_timestamp: int | None = Field(
         ...,
-        description="The timestamp from the server when the value was received.",
+        description=(
+            "The timestamp from the server when the value was received, "
+            "in milliseconds since the Unix epoch."
+        ),
     )
     status_code: int = Field(
         ..., description="The numeric status code of the value (0 indicates good quality)."
@@ -42,11 +52,12 @@ class TagData(BaseModel):
 
     class Config:
         # Pydantic v2 config
+        frozen = True
         json_schema_extra = {
             "example": {
                 "value": 123.45,
-                "source_timestamp": "2023-10-27T10:00:00Z",
-                "server_timestamp": "2023-10-27T10:00:01Z",
+                "source_timestamp": 1698400800000,
+                "server_timestamp": 1698400801000,
                 "status_code": 0,
                 "status_text": "Good",
             }
@@ -62,25 +73,48 @@ class AllTagsResponse(BaseModel):
     )
 
 
+class ColumnarTagsResponse(BaseModel):
+    """
+    Column-oriented response model for the endpoint that retrieves all tags.
+
+    Each field holds one entry per tag; entries at the same index belong to
+    the tag at that index in `names`.
+    """
+    names: List[str] = Field(..., description="The names of all monitored tags.")
+    values: List[Any] = Field(..., description="The current value of each tag.")
+    source_timestamps: List[int | None] = Field(
+        ..., description="The source timestamp of each tag's value, in epoch milliseconds."
+    )
+    server_timestamps: List[int | None] = Field(
+        ..., description="The server timestamp of each tag's value, in epoch milliseconds."
+    )
+    status_codes: List[int] = Field(
+        ..., description="The numeric status code of each tag's value."
+    )
+    status_texts: List[str] = Field(
+        ..., description="The human-readable status of each tag's value."
+    )
+
+
 # --- Router and Dependencies ---
 
+# No prefix here: `server.py` mounts the router under `/api`.
 router = APIRouter(
-    prefix="/api",
     tags=["OPC UA Tags"],
 )
 
 logger = logging.getLogger(__name__)
 
 
-def get_opcua_client(request: Request) -> OpcuaClient:
+def get_opcua_client(request: HTTPConnection) -> OpcuaClient:
     """
-    FastAPI dependency to get the singleton OpcuaClient instance.
+    FastAPI dependency to get the application's OpcuaClient instance.
 
     The client is expected to be initialized and attached to the app's state
     during the application startup lifecycle event.
 
     Args:
-        request: The incoming FastAPI request.
+        request: The incoming FastAPI request or WebSocket connection.
 
     Returns:
         The running OpcuaClient instance.
@@ -89,11 +123,14 @@ def get_opcua_client(request: Request) -> OpcuaClient:
         RuntimeError: If the OpcuaClient is not found in the app state,
                       indicating a server startup problem.
     """
-    if not hasattr(request.app.state, "opcua_client"):
+    # A single lookup with a default avoids the `hasattr` + attribute read pair
+    # on every request.
+    client = getattr(request.app.state, "opcua_client", None)
+    if client is None:
         logger.error("OpcuaClient not found in application state. It may not have been initialized correctly.")
         # This is a server error, not a client error.
         raise RuntimeError("OpcuaClient not initialized or attached to app state.")
-    return request.app.state.opcua_client
+    return client
 
 
 # --- API Endpoints ---
@@ -101,44 +138,150 @@ def get_opcua_client(request: Request) -> OpcuaClient:
 
 @router.get(
     "/tags",
-    response_model=AllTagsResponse,
+    response_model=Union[AllTagsResponse, ColumnarTagsResponse],
     summary="Get all monitored tags",
-    description="Retrieves the latest known values for all OPC UA tags configured for monitoring.",
+    description=(
+        "Retrieves the latest known values for all OPC UA tags configured for monitoring. "
+        "With `layout=columnar`, the same data is laid out as one list per field instead "
+        "of one object per tag, which is considerably smaller for large tag sets."
+    ),
 )
 async def get_all_tags(
+    layout: Literal["rows", "columnar"] = Query(
+        "rows", description="`rows` for one object per tag, `columnar` for parallel lists."
+    ),
     client: OpcuaClient = Depends(get_opcua_client),
-) -> AllTagsResponse:
+) -> Response:
     """
     Endpoint to fetch data for all monitored OPC UA tags.
 
     This reads the current values from the client's internal data cache, which is
     updated by the background OPC UA subscription.
+
+    The client keeps the whole listing, in both layouts, as an already-encoded
+    JSON document that is rebuilt only when a tag changes, so the response is
+    returned as-is and FastAPI's validation and serialization are skipped
+    entirely. The `response_model` declaration is kept for the OpenAPI schema
+    only.
+
+    The columnar layout is selected with a query parameter rather than a path
+    below `/tags`, which would shadow a tag of the same name.
     """
-    logger.info("API request received for all tags.")
-    all_data = await client.get_all_tag_data()
-
-    # Format the data to match the Pydantic model
-    formatted_tags: Dict[str, TagData] = {}
-    for tag_name, data_value in all_data.items():
-        if data_value:
-            formatted_tags[tag_name] = TagData(
-                value=data_value.Value.Value,
-                source_timestamp=data_value.SourceTimestamp,
-                server_timestamp=data_value.ServerTimestamp,
-                status_code=data_value.StatusCode.Value,
-                status_text=data_value.StatusCode.name,
-            )
-        else:
-            # Handle case where a tag is configured but has no data yet
-            formatted_tags[tag_name] = TagData(
-                value=None,
-                source_timestamp=None,
-                server_timestamp=None,
-                status_code=0x80000000, # Bad
-                status_text="NoData",
-            )
+    logger.info("API request received for all tags (%s).", layout)
+    if layout == "columnar":
+        body = await client.get_columnar_snapshot_bytes()
+    else:
+        body = await client.get_snapshot_bytes()
+    return Response(content=body, media_type="application/json")
+
+
+# Under `/nodes`, not `/tags`: these are NodeIds, not configured tag names, and
+# a fixed path below `/tags` would shadow a tag of the same name.
+@router.get(
+    "/nodes/values",
+    response_model=Dict[str, TagData],
+    summary="Read the current values of several nodes",
+    description=(
+        "Reads the given OPC UA nodes directly from the server in a single request, "
+        "bypassing the subscription cache. Each value comes with its status, so a "
+        "failed read is not mistaken for a null value."
+    ),
+    responses={
+        400: {"description": "One of the NodeIds is malformed."},
+        503: {"description": "The OPC UA client is not connected."},
+    },
+)
+async def read_node_values(
+    ids: List[str] = Query(..., description="The NodeId strings to read, e.g. `ids=ns=2;i=2`."),
+    client: OpcuaClient = Depends(get_opcua_client),
+) -> Response:
+    """
+    Endpoint to read the live values of several OPC UA nodes at once.
+
+    Args:
+        ids: The NodeId strings to read.
+        client: The injected OpcuaClient instance.
+
+    Returns:
+        A mapping of each requested NodeId string to its `TagData`, already
+        serialized.
+
+    Raises:
+        HTTPException: If a NodeId is malformed, or if the client is not
+                       connected to the OPC UA server.
+    """
+    logger.info("API request received to read %d nodes.", len(ids))
+    try:
+        results = await client.read_values(ids)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ConnectionError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    body = orjson.dumps(dict(zip(ids, results)), default=json_default, option=JSON_OPTIONS)
+    return Response(content=body, media_type="application/json")
+
+
+# Under `/ws`, not `/tags`, so it doesn't shadow a tag named "ws".
+@router.websocket("/ws/tags")
+async def stream_tag_updates(
+    websocket: WebSocket, client: OpcuaClient = Depends(get_opcua_client)
+):
+    """
+    WebSocket endpoint that pushes every tag value change as it happens.
 
-    return AllTagsResponse(tags=formatted_tags)
+    Each message is a JSON-encoded `TagBatchUpdate` holding the tags that changed
+    in one OPC UA publish cycle. Only changes are sent, so clients should fetch
+    `/tags` once for the initial state instead of polling it. A client that
+    falls too far behind is disconnected with code 1013 and must refetch `/tags`
+    before reconnecting.
+
+    Tag values may not change for a long time, so the socket is read
+    concurrently with the update queue: a client that goes away is unsubscribed
+    right away instead of on the next failed send. Messages from the client are
+    ignored.
+
+    Args:
+        websocket: The client's WebSocket connection.
+        client: The injected OpcuaClient instance.
+    """
+    await websocket.accept()
+    try:
+        queue = client.subscribe()
+    except ConnectionError as e:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason=str(e))
+        return
+
+    logger.info("WebSocket subscriber connected for tag updates.")
+    receive_task = asyncio.ensure_future(websocket.receive())
+    get_task = asyncio.ensure_future(queue.get())
+    try:
+        while True:
+            done, _ = await asyncio.wait(
+                (receive_task, get_task), return_when=asyncio.FIRST_COMPLETED
+            )
+            if receive_task in done:
+                if receive_task.result()["type"] == "websocket.disconnect":
+                    logger.info("WebSocket subscriber disconnected.")
+                    return
+                receive_task = asyncio.ensure_future(websocket.receive())
+            if get_task in done:
+                message = get_task.result()
+                if message is RESYNC_REQUIRED:
+                    await websocket.close(
+                        code=status.WS_1013_TRY_AGAIN_LATER,
+                        reason="Too far behind; refetch /tags and reconnect.",
+                    )
+                    return
+                await websocket.send_text(message)
+                get_task = asyncio.ensure_future(queue.get())
+    except (WebSocketDisconnect, OSError) as e:
+        # The connection broke while sending; the server reports this as an
+        # OSError rather than a disconnect message.
+        logger.info("WebSocket subscriber disconnected: %r", e)
+    finally:
+        receive_task.cancel()
+        get_task.cancel()
+        client.unsubscribe(queue)
 
 
 @router.get(
@@ -150,7 +293,7 @@ async def get_all_tags(
 )
 async def get_tag_by_name(
     tag_name: str, client: OpcuaClient = Depends(get_opcua_client)
-) -> TagData:
+) -> Response:
     """
     Endpoint to fetch data for a specific OPC UA tag by its configured name.
 
@@ -159,26 +302,23 @@ async def get_tag_by_name(
         client: The injected OpcuaClient instance.
 
     Returns:
-        The data for the requested tag.
+        The data for the requested tag, already serialized as `TagData` JSON.
 
     Raises:
         HTTPException: If the tag is not found in the client's monitored tags.
     """
-    logger.info(f"API request received for tag: {tag_name}")
-    data_value = await client.get_tag_data(tag_name)
+    logger.info("API request received for tag: %s", tag_name)
+    # Served from the client's in-memory state, so there is nothing to await.
+    payload = client.get_tag_payload(tag_name)
 
-    if data_value is None:
-        logger.warning(f"Tag '{tag_name}' not found for API request.")
+    if payload is None:
+        logger.warning("Tag '%s' not found for API request.", tag_name)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tag '{tag_name}' not found. It might not be configured for monitoring or has not received data yet.",
         )
 
-    return TagData(
-        value=data_value.Value.Value,
-        source_timestamp=data_value.SourceTimestamp,
-        server_timestamp=data_value.ServerTimestamp,
-        status_code=data_value.StatusCode.Value,
-        status_text=data_value.StatusCode.name,
-    )
-```
\ No newline at end of file
+    # The payload already has the `TagData` fields, as in the `/tags` snapshot,
+    # so it is encoded directly without FastAPI's response validation.
+    body = orjson.dumps(payload, default=json_default, option=JSON_OPTIONS)
+    return Response(content=body, media_type="application/json")
@@ -8,18 +8,23 @@ lifecycle of the OPC UA client connection.
 """
 
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from jupiter_scada import __version__
 from jupiter_scada.api.endpoints import router as api_router
+from jupiter_scada.core.config import settings
 # This import assumes the OPC UA client logic is structured in a dedicated package.
 # This client is responsible for all communication with the OPC UA server.
 from jupiter_scada.opcua.client import OpcuaClient
+from jupiter_scada.opcua.snapshot import TagSnapshotReader
 
 # --- Setup Logging ---
 logger = logging.getLogger(__name__)
@@ -33,6 +38,97 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 STATIC_DIR = BASE_DIR / "static"
 TEMPLATES_DIR = BASE_DIR / "templates"
 
+# How long browsers may cache frontend assets before revalidating them.
+STATIC_CACHE_MAX_AGE_SECONDS = 3600
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles variant that lets browsers cache assets.
+
+    Without a `Cache-Control` header every dashboard page load re-requests each
+    asset. Revalidation still works through the ETag/Last-Modified headers
+    Starlette already sends.
+    """
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault(
+            "Cache-Control", f"public, max-age={STATIC_CACHE_MAX_AGE_SECONDS}"
+        )
+        return response
+
+
+# --- Mount Static Files for Frontend ---
+def mount_static_files(app: FastAPI) -> None:
+    """
+    Serves files like CSS, JavaScript, and images for the web UI under `/static`.
+
+    In production, a reverse proxy (e.g. nginx with `sendfile on`) can serve
+    `/static/` directly from disk instead; set SERVE_STATIC_FILES=false then.
+    This is called on startup rather than at import time, as it reads the
+    settings.
+
+    Args:
+        app: The application to mount the files on.
+    """
+    if any(getattr(route, "name", None) == "static" for route in app.routes):
+        # Already mounted by an earlier startup of the same app (e.g. in tests)
+        return
+    if not settings.serve_static_files:
+        logger.info("Static file serving disabled; expecting a reverse proxy to serve '/static'.")
+    elif STATIC_DIR.is_dir():
+        app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+        logger.info("Mounted static files directory: %s", STATIC_DIR)
+    else:
+        logger.warning(
+            "Static files directory not found at '%s'. "
+            "Frontend assets will not be served.",
+            STATIC_DIR,
+        )
+
+
+# --- OPC UA Client Lifecycle Management ---
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan handler.
+
+    On startup:
+    - Mounts the frontend's static files, unless disabled.
+    - Creates the OPC UA client and starts its background tasks, which connect
+      to the configured server and subscribe to all tags.
+    - Attaches the client to `app.state` for the API dependencies.
+
+    On shutdown:
+    - Stops the OPC UA client and disconnects it gracefully.
+    """
+    logger.info("Application starting up...")
+    mount_static_files(app)
+    if settings.tag_snapshot_path is not None:
+        # A separate OPC UA worker owns the session; this process only reads
+        # the snapshots it publishes, so it can safely run as multiple workers.
+        app.state.opcua_client = TagSnapshotReader(settings.tag_snapshot_path)
+        logger.info("Serving tag data from snapshot file: %s", settings.tag_snapshot_path)
+        yield
+        logger.info("Application shutting down...")
+        return
+
+    # Created here rather than at import time, so importing this module (e.g.
+    # from tests that override the client dependency) stays cheap.
+    opcua_client = OpcuaClient()
+    # The connection manager connects and retries in the background, so a
+    # server that is down at startup doesn't prevent the API from starting.
+    await opcua_client.start()
+    app.state.opcua_client = opcua_client
+    logger.info("OPC UA client started.")
+
+    yield
+
+    logger.info("Application shutting down...")
+    await opcua_client.stop()
+    logger.info("OPC UA client stopped.")
+
 
 # --- FastAPI Application Initialization ---
 app = FastAPI(
@@ -43,75 +139,44 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
+    # orjson encodes datetimes and floats natively in C, which is considerably
+    # faster than the stdlib `json` module for large tag listings.
+    default_response_class=ORJSONResponse,
 )
 
+# --- Response Compression ---
+# Tag listings are highly repetitive JSON and compress well, which benefits
+# dashboards polling over slow links. Tiny responses are sent uncompressed.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
-# --- OPC UA Client Lifecycle Management ---
-# The OpcuaClient is a singleton; we get its single instance here.
-opcua_client = OpcuaClient.get_instance()
-
-@app.on_event("startup")
-async def startup_event():
-    """
-    Application startup logic:
-    - Connects the OPC UA client to the configured server.
-    - Starts the background subscription task to monitor tags.
-    """
-    logger.info("Application starting up...")
-    try:
-        await opcua_client.connect()
-        # The subscription is started after the config is loaded,
-        # which happens during client initialization.
-        await opcua_client.start_subscription()
-        logger.info("OPC UA client connected and subscription started.")
-    except Exception as e:
-        logger.critical(f"Failed to connect to OPC UA server on startup: {e}", exc_info=True)
-        # In a production environment, you might want to implement a retry mechanism
-        # or prevent the application from starting if the connection is critical.
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Application shutdown logic:
-    - Disconnects the OPC UA client gracefully.
-    """
-    logger.info("Application shutting down...")
-    await opcua_client.disconnect()
-    logger.info("OPC UA client disconnected.")
-
-
-# --- Mount Static Files for Frontend ---
-# This serves files like CSS, JavaScript, and images for the web UI.
-if STATIC_DIR.is_dir():
-    app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
-    logger.info(f"Mounted static files directory: {STATIC_DIR}")
-else:
-    logger.warning(
-        f"Static files directory not found at '{STATIC_DIR}'. "
-        "Frontend assets will not be served."
-    )
 
 # --- Setup Template Engine for index.html ---
 # Jinja2 is used to serve the main entrypoint of the frontend.
 if TEMPLATES_DIR.is_dir():
     templates = Jinja2Templates(directory=TEMPLATES_DIR)
-    logger.info(f"Initialized Jinja2 templates from: {TEMPLATES_DIR}")
+    logger.info("Initialized Jinja2 templates from: %s", TEMPLATES_DIR)
+
+    # The index page has no per-request content, so it is rendered once here
+    # and every request is served the same pre-encoded bytes.
+    INDEX_HTML: bytes = (
+        templates.get_template("index.html").render(title="Jupiter SCADA").encode("utf-8")
+    )
 
     # --- Root Endpoint to Serve Frontend ---
     @app.get("/", response_class=HTMLResponse, include_in_schema=False)
-    async def serve_frontend(request: Request):
+    async def serve_frontend():
         """
         Serves the main `index.html` file which acts as the entry point
         for the web-based user interface (e.g., a single-page application).
         """
         logger.debug("Request for root path, serving index.html")
-        return templates.TemplateResponse(
-            "index.html", {"request": request, "title": "Jupiter SCADA"}
-        )
+        return HTMLResponse(INDEX_HTML)
 else:
     logger.warning(
-        f"Templates directory not found at '{TEMPLATES_DIR}'. "
-        "The root '/' endpoint will not serve a web page."
+        "Templates directory not found at '%s'. "
+        "The root '/' endpoint will not serve a web page.",
+        TEMPLATES_DIR,
     )
     # Provide a fallback JSON response if templates are not found.
     @app.get("/", include_in_schema=False)
@@ -127,4 +192,3 @@ else:
 # This keeps the API versionable and separate from the frontend routes.
 app.include_router(api_router, prefix="/api")
 logger.info("API router included with prefix '/api'.")
-```
\ No newline at end of file
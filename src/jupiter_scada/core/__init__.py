@@ -26,5 +26,3 @@ for example: `from jupiter_scada.core import OpcuaClient`.
 # `from jupiter_scada.core.opcua_client import OpcuaClient`
 #
 # This approach keeps the dependencies explicit and the structure clear.
-
-```
\ No newline at end of file
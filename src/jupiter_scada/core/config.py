@@ -14,6 +14,13 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+# Prefer the libyaml-backed loader, which parses large tag lists much faster
+# than the pure-Python implementation. Fall back if PyYAML was built without it.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as YamlLoader
+
 # Set up a logger for this module
 logger = logging.getLogger(__name__)
 
@@ -28,33 +35,59 @@ class Settings:
     """
 
     _instance = None
+    _initialized = False
+    _loading = False
 
     def __new__(cls):
         """Ensures that only one instance of the Settings class is created."""
         if cls._instance is None:
             cls._instance = super(Settings, cls).__new__(cls)
-            # Call an internal initializer to avoid re-initialization on every access
-            cls._instance._initialize()
         return cls._instance
 
+    def __getattr__(self, name: str) -> Any:
+        """
+        Loads the configuration on first access to a setting.
+
+        This is only invoked for attributes that are not set yet, so once the
+        settings are loaded, attribute access carries no extra overhead. Deferring
+        the load keeps importing this module cheap. If loading fails, the error
+        propagates and the next access tries again.
+        """
+        if name.startswith("__") or self._initialized or self._loading:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        self._initialize()
+        return getattr(self, name)
+
     def _initialize(self) -> None:
         """
         Initializes the configuration by loading all sources.
-        This method is called only once when the instance is created.
+        This method is called on first access to a setting, and again on the next
+        access if loading failed.
         """
-        logger.info("Initializing application settings...")
+        # A missing attribute accessed while loading raises instead of recursing.
+        # Only a completed load marks the settings as initialized, so a failure
+        # is reported again on the next access rather than hidden behind
+        # "no attribute" errors.
+        self._loading = True
+        try:
+            logger.info("Initializing application settings...")
 
-        # 1. Define project root and configuration paths
-        self.project_root: Path = self._find_project_root()
-        self.config_file_path: Path = self.project_root / "config" / "config.yaml"
-        logger.info(f"Project root identified as: {self.project_root}")
-        logger.info(f"Expecting configuration file at: {self.config_file_path}")
+            # 1. Define project root and configuration paths
+            self.project_root: Path = self._find_project_root()
+            self.config_file_path: Path = self.project_root / "config" / "config.yaml"
+            logger.info("Project root identified as: %s", self.project_root)
+            logger.info("Expecting configuration file at: %s", self.config_file_path)
 
-        # 2. Load settings from environment variables
-        self._load_env_vars()
+            # 2. Load settings from environment variables
+            self._load_env_vars()
 
-        # 3. Load settings from YAML file
-        self._load_yaml_config()
+            # 3. Load settings from YAML file
+            self._load_yaml_config()
+        finally:
+            self._loading = False
+        self._initialized = True
 
         logger.info("Settings initialization complete.")
 
@@ -62,7 +95,14 @@ class Settings:
         """
         Finds the project root directory by searching upwards for a marker file.
         The marker file is `.gitignore` in this case.
+
+        The search is skipped entirely if the `JUPITER_PROJECT_ROOT` environment
+        variable is set, e.g. in containers where the layout is known.
         """
+        configured_root = os.getenv("JUPITER_PROJECT_ROOT")
+        if configured_root:
+            return Path(configured_root).resolve()
+
         current_path = Path(__file__).resolve()
         # Search up the directory tree from the current file's location
         while current_path != current_path.parent:
@@ -88,6 +128,25 @@ class Settings:
         else:
             logger.info("Loaded OPCUA_SERVER_URL from environment.")
 
+        # Optional keepalive reads, for detecting half-open connections faster
+        # than TCP does; lost sockets and sessions are detected without them.
+        self.opcua_keepalive_seconds: float = float(os.getenv("OPCUA_KEEPALIVE_SECONDS", "0"))
+
+        # Address the web server listens on (see `jupiter_scada.main`)
+        self.api_host: str = os.getenv("API_HOST", "127.0.0.1")
+        self.api_port: int = int(os.getenv("API_PORT", "8000"))
+
+        # When set, the OPC UA client runs in a separate worker process
+        # (`python -m jupiter_scada.opcua.worker`) that publishes tag data to
+        # this file, and the web server only reads from it.
+        snapshot_path = os.getenv("TAG_SNAPSHOT_PATH")
+        self.tag_snapshot_path: Optional[Path] = Path(snapshot_path) if snapshot_path else None
+
+        # Disable when a reverse proxy serves the frontend assets itself.
+        self.serve_static_files: bool = (
+            os.getenv("SERVE_STATIC_FILES", "true").strip().lower() not in ("0", "false", "no")
+        )
+
     def _load_yaml_config(self) -> None:
         """Loads the main configuration from the `config.yaml` file."""
         # Set default empty values
@@ -108,7 +167,7 @@ class Settings:
 
         try:
             with open(self.config_file_path, "r", encoding="utf-8") as f:
-                self.raw_yaml_config = yaml.safe_load(f)
+                self.raw_yaml_config = yaml.load(f, Loader=YamlLoader)
 
             if self.raw_yaml_config:
                 # Get the list of tags, default to an empty list if 'tags' key is missing
@@ -142,4 +201,5 @@ class Settings:
 # Create a single, globally accessible instance of the Settings class.
 # Other modules can import this object to access configuration values.
 # e.g., from jupiter_scada.core.config import settings
+# The configuration itself is loaded lazily, on first attribute access.
 settings = Settings()
\ No newline at end of file
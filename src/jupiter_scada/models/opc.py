@@ -8,8 +8,9 @@ parsing configuration files, for internal data management, and for defining
 the schemas for API responses.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -65,6 +66,33 @@ class TagData(TagConfig):
         # Allows the model to be populated from object attributes,
         # which is useful for creating this model from other class instances.
         from_attributes = True
+        # Instances are snapshots of a tag at one point in time; freezing them
+        # also makes them hashable and safe to share between responses.
+        frozen = True
+
+
+@dataclass(slots=True, frozen=True)
+class LiveTag:
+    """
+    Represents the latest known state of a monitored tag inside the OPC UA client.
+
+    This is the internal counterpart of `TagData`. It is updated on every data
+    change, so it is a plain slotted dataclass rather than a Pydantic model:
+    constructing it runs no field validation and instances carry no `__dict__`.
+    Instances are immutable; an update replaces the tag's entry in the data store
+    with a new instance, so readers never observe a partially updated tag.
+
+    `timestamp` is the source timestamp reported by the server, if any.
+    `received_at` is the local receive time in epoch seconds, or None while the
+    tag has not received any data. The API falls back to it for values without
+    a source timestamp, converting it only when building the response.
+    """
+    name: str
+    node_id: str
+    value: Optional[Any] = None
+    status: str = "Uncertain"
+    timestamp: Optional[datetime] = None
+    received_at: Optional[float] = None
 
 
 class TagValueUpdate(BaseModel):
@@ -81,13 +109,27 @@ class TagValueUpdate(BaseModel):
         description="The new value of the tag.",
         examples=[125.5]
     )
-    timestamp: datetime = Field(
+    timestamp: Optional[int] = Field(
         ...,
-        description="The timestamp of the new value."
+        description=(
+            "The source timestamp of the new value, or its receive time if the server "
+            "reports none, in milliseconds since the Unix epoch."
+        ),
+        examples=[1698400800000]
     )
     status: str = Field(
         ...,
         description="The quality status of the new value.",
         examples=["Good"]
     )
-```
\ No newline at end of file
+
+
+class TagBatchUpdate(BaseModel):
+    """
+    Represents the tag changes of one OPC UA publish cycle, pushed as a single
+    WebSocket message.
+    """
+    updates: List[TagValueUpdate] = Field(
+        ...,
+        description="The updates for every tag that changed in the cycle."
+    )
@@ -10,8 +10,7 @@ The primary component is the `OpcuaClient`, which acts as the main interface
 for the rest of the application to communicate with the OPC UA server.
 """
 
-from .client import OpcuaClient
-from .handler import SubscriptionHandler
+from .client import OpcuaClient, SubscriptionHandler
 
 __all__ = [
     "OpcuaClient",
@@ -6,28 +6,272 @@ This module provides the `OpcuaClient` class, which handles all interactions
 with the OPC UA server. It uses the `asyncua` library to manage connections,
 subscriptions, and data handling in an asynchronous manner.
 
-The client is designed as a singleton, with a single instance (`opcua_client`)
-instantiated at the module level for use throughout the application.
+A single instance is created by whichever process owns the OPC UA session:
+the API server's lifespan handler, or the standalone worker (`worker.py`).
 """
 
 import asyncio
+import base64
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import sys
+from datetime import datetime, timedelta, timezone
+from time import time
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Set, Tuple
 
-from asyncua import Client, ua
+import orjson
+from asyncua import Client, Node, ua
 from asyncua.common.subscription import Subscription
+from asyncua.ua.status_codes import code_to_name_doc
 
 from jupiter_scada.core.config import settings
-from jupiter_scada.models.opc import LiveTag, Tag
+from jupiter_scada.models.opc import LiveTag, TagConfig
 
 # --- Constants ---
 RECONNECT_INTERVAL_SECONDS = 10
+# Limit for the optional keepalive read (see `settings.opcua_keepalive_seconds`)
+KEEPALIVE_TIMEOUT_SECONDS = 4
+# Messages buffered per push subscriber before it is considered out of sync.
+SUBSCRIBER_QUEUE_SIZE = 1000
+# Put on a subscriber's queue in place of its pending messages once it has
+# fallen behind; the subscriber must then refetch the full state.
+RESYNC_REQUIRED = None
+# Status code reported for tags that are configured but have no data yet.
+NO_DATA_STATUS_CODE = ua.StatusCodes.BadWaitingForInitialData
+# Snapshots are encoded this many tags at a time, yielding to the event loop
+# in between. orjson holds the GIL while it runs, so a worker thread wouldn't
+# keep the loop responsive; splitting the work does.
+ENCODE_CHUNK_TAGS = 500
+# Same options FastAPI's ORJSONResponse uses.
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+# Resolved once at import instead of looking up `StatusCode.name` per update.
+# Codes that aren't in asyncua's table are added on first use.
+_STATUS_NAMES: Dict[int, str] = {
+    code: sys.intern(name) for code, (name, _doc) in code_to_name_doc.items()
+}
+NO_DATA_STATUS_TEXT = _STATUS_NAMES[NO_DATA_STATUS_CODE]
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MILLISECOND = timedelta(milliseconds=1)
 
 # --- Logger ---
 logger = logging.getLogger(__name__)
 
 
+def status_name(status_code: ua.StatusCode) -> str:
+    """
+    Returns the symbolic name of an OPC UA status code (e.g. 'Good').
+
+    Args:
+        status_code: The status code of a DataValue.
+
+    Returns:
+        The status name from the precomputed table. Codes that aren't in it
+        (e.g. codes with info bits set) are resolved by asyncua once and then
+        cached in the table.
+    """
+    code = status_code.value
+    name = _STATUS_NAMES.get(code)
+    if name is None:
+        # Interned, so every tag reporting this status shares one string.
+        name = _STATUS_NAMES[code] = sys.intern(status_code.name)
+    return name
+
+
+def to_epoch_ms(timestamp: Optional[datetime]) -> Optional[int]:
+    """
+    Converts an OPC UA timestamp to integer milliseconds since the Unix epoch.
+
+    Args:
+        timestamp: The timestamp to convert. asyncua reports naive datetimes,
+                   which are in UTC.
+
+    Returns:
+        The timestamp in epoch milliseconds, or None if no timestamp was given.
+    """
+    if timestamp is None:
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    # Integer timedelta division avoids float rounding errors.
+    return (timestamp - _EPOCH) // _ONE_MILLISECOND
+
+
+def source_epoch_ms(live_tag: LiveTag) -> Optional[int]:
+    """
+    Returns a tag's source timestamp in epoch milliseconds, as served by the API.
+
+    Args:
+        live_tag: The tag's state in the data store.
+
+    Returns:
+        The source timestamp reported by the server or, for servers that don't
+        report one, the local receive time. None if the tag has no data yet.
+    """
+    if live_tag.timestamp is not None:
+        return to_epoch_ms(live_tag.timestamp)
+    if live_tag.received_at is not None:
+        return int(live_tag.received_at * 1000)
+    return None
+
+
+def _tag_payload(
+    live_tag: LiveTag, status_code: int, server_timestamp: Optional[datetime]
+) -> Dict[str, Any]:
+    """
+    Builds the API representation of a tag (the `TagData` shape).
+
+    Args:
+        live_tag: The tag's state in the data store.
+        status_code: The numeric status code matching `live_tag.status`.
+        server_timestamp: The server timestamp of the tag's value, if any.
+
+    Returns:
+        The tag's payload, as served by the API.
+    """
+    return {
+        "value": live_tag.value,
+        "source_timestamp": source_epoch_ms(live_tag),
+        "server_timestamp": to_epoch_ms(server_timestamp),
+        "status_code": status_code,
+        "status_text": live_tag.status,
+    }
+
+
+def data_value_payload(data_value: ua.DataValue) -> Dict[str, Any]:
+    """
+    Builds the API representation of a DataValue read directly from the server.
+
+    Args:
+        data_value: The DataValue returned by an OPC UA Read.
+
+    Returns:
+        The value in the `TagData` shape, with its status, so that callers can
+        tell a failed read from a null value.
+    """
+    variant = data_value.Value
+    return {
+        "value": variant.Value if variant is not None else None,
+        "source_timestamp": to_epoch_ms(data_value.SourceTimestamp),
+        "server_timestamp": to_epoch_ms(data_value.ServerTimestamp),
+        "status_code": data_value.StatusCode.value,
+        "status_text": status_name(data_value.StatusCode),
+    }
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Encodes tag values that orjson doesn't support natively.
+
+    Passed as `default` to every `orjson.dumps` of tag data, so a single
+    unusual value can't make a whole snapshot unencodable.
+
+    Args:
+        obj: The value orjson could not encode.
+
+    Returns:
+        ByteString values as base64 text, as in the OPC UA JSON encoding;
+        anything else as its string form.
+    """
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return base64.b64encode(obj).decode("ascii")
+    return str(obj)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encodes tag data with the options and fallback shared by every snapshot."""
+    return orjson.dumps(obj, default=json_default, option=JSON_OPTIONS)
+
+
+async def _dumps_list(items: List[Any]) -> bytes:
+    """
+    Encodes a list as a JSON array, `ENCODE_CHUNK_TAGS` items at a time.
+
+    Args:
+        items: The values to encode.
+
+    Returns:
+        The encoded array.
+    """
+    if len(items) <= ENCODE_CHUNK_TAGS:
+        return _dumps(items)
+    parts = []
+    for start in range(0, len(items), ENCODE_CHUNK_TAGS):
+        if start:
+            await asyncio.sleep(0)
+        # Strip the brackets of each chunk's array and join the elements.
+        parts.append(_dumps(items[start:start + ENCODE_CHUNK_TAGS])[1:-1])
+    return b"[" + b",".join(parts) + b"]"
+
+
+async def encode_tags(tag_payloads: Dict[str, Dict[str, Any]]) -> bytes:
+    """
+    Encodes tag data as an `AllTagsResponse` JSON document.
+
+    Large tag sets are encoded in chunks so that other requests and OPC UA
+    notifications are served in between.
+
+    Args:
+        tag_payloads: The API-ready data of each tag, keyed by tag name.
+
+    Returns:
+        The encoded document.
+    """
+    # Copied before the first await, so the document reflects a single point
+    # in time. Payloads are replaced on update, never mutated.
+    items = list(tag_payloads.items())
+    if len(items) <= ENCODE_CHUNK_TAGS:
+        return _dumps({"tags": tag_payloads})
+    parts = []
+    for start in range(0, len(items), ENCODE_CHUNK_TAGS):
+        if start:
+            await asyncio.sleep(0)
+        # Strip the braces of each chunk's object and join the members.
+        parts.append(_dumps(dict(items[start:start + ENCODE_CHUNK_TAGS]))[1:-1])
+    return b'{"tags":{' + b",".join(parts) + b"}}"
+
+
+async def encode_tags_columnar(tag_payloads: Dict[str, Dict[str, Any]]) -> bytes:
+    """
+    Encodes tag data as a column-oriented JSON document.
+
+    Instead of one object per tag, each field becomes a list with one entry per
+    tag, in the same order as `names`. This avoids repeating every key name for
+    each tag, which roughly halves the document size for large tag sets. Like
+    `encode_tags`, large tag sets are encoded in chunks.
+
+    Args:
+        tag_payloads: The API-ready data of each tag, keyed by tag name.
+
+    Returns:
+        The encoded `ColumnarTagsResponse` document.
+    """
+    items = list(tag_payloads.items())
+    names: List[str] = []
+    values: List[Any] = []
+    source_timestamps: List[Optional[int]] = []
+    server_timestamps: List[Optional[int]] = []
+    status_codes: List[int] = []
+    status_texts: List[str] = []
+    for i, (name, payload) in enumerate(items, 1):
+        names.append(name)
+        values.append(payload["value"])
+        source_timestamps.append(payload["source_timestamp"])
+        server_timestamps.append(payload["server_timestamp"])
+        status_codes.append(payload["status_code"])
+        status_texts.append(payload["status_text"])
+        if i % ENCODE_CHUNK_TAGS == 0:
+            await asyncio.sleep(0)
+    columns = {
+        "names": names,
+        "values": values,
+        "source_timestamps": source_timestamps,
+        "server_timestamps": server_timestamps,
+        "status_codes": status_codes,
+        "status_texts": status_texts,
+    }
+    parts = [_dumps(key) + b":" + await _dumps_list(column) for key, column in columns.items()]
+    return b"{" + b",".join(parts) + b"}"
+
+
 class SubscriptionHandler:
     """
     Handles data change notifications from an OPC UA subscription.
@@ -45,7 +289,7 @@ class SubscriptionHandler:
         self._client = client
         logger.info("SubscriptionHandler initialized.")
 
-    def datachange_notification(self, node: ua.Node, val: Any, data: ua.DataChangeNotification):
+    def datachange_notification(self, node: Node, val: Any, data: ua.DataChangeNotification):
         """
         Callback for data change events.
 
@@ -54,47 +298,106 @@ class SubscriptionHandler:
             val: The new value of the node.
             data: The full data change notification object.
         """
-        asyncio.create_task(self._client.update_tag_value_from_node(node, data.monitored_item.Value))
-        logger.debug(f"Data change: Node={node}, Value={val}")
+        # Queued for the client's single consumer task instead of spawning a
+        # task per notification.
+        self._client.enqueue_update(node, data.monitored_item.Value)
+        # Formatting the message is skipped entirely unless DEBUG is enabled.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Data change: Node=%s, Value=%s", node, val)
 
     def event_notification(self, event: ua.EventNotificationList):
         """Callback for event notifications."""
-        logger.info(f"Event notification received: {event}")
+        logger.info("Event notification received: %s", event)
+
+    def status_change_notification(self, status: ua.StatusCode):
+        """
+        Callback for subscription status changes.
+
+        A bad status means the server closed the session or the subscription
+        timed out, so the client must reconnect.
+
+        Args:
+            status: The new status of the subscription.
+        """
+        if not status.is_good():
+            self._client.connection_lost(f"subscription status changed to {status.name}")
 
 
 class OpcuaClient:
     """
     Manages the connection and data exchange with an OPC UA server.
+
+    The tag state (`_data_store`, `_tag_payloads` and the cached snapshots) is
+    not guarded by a lock. It is only written by `update_tag_value_from_node`,
+    which never awaits, so on the event loop no reader can observe an update
+    half-applied. Keep it that way: state that must change across an `await`
+    belongs in the update queue, not behind an `asyncio.Lock`. The one exception
+    is caching a snapshot encoded in chunks, which checks `_payloads_version`
+    before storing it and is shared by every reader that asks for it meanwhile.
     """
 
     def __init__(self):
         """Initializes the OpcuaClient."""
-        self.server_url: str = settings.opcua.server_url
+        self.server_url: str = settings.opcua_server_url
+        # Seconds between keepalive reads of an otherwise quiet session; 0 disables them
+        self.keepalive_interval: float = settings.opcua_keepalive_seconds
         self.client: Client = Client(url=self.server_url)
         self.subscription: Optional[Subscription] = None
         self.sub_handler: SubscriptionHandler = SubscriptionHandler(self)
+        # Validated once; the tag configuration doesn't change at runtime and is
+        # walked again on every reconnect.
+        self._all_tag_configs: Tuple[TagConfig, ...] = tuple(
+            TagConfig.model_validate(tag) for tag in settings.tags
+        )
 
         self._is_connected: bool = False
         self._running: bool = False
         self._connection_task: Optional[asyncio.Task] = None
+        # Set whenever the client is disconnected and a connection attempt is due
+        self._disconnect_event: asyncio.Event = asyncio.Event()
+        # Datachange notifications waiting to be applied by `_update_task`
+        self._update_queue: "asyncio.Queue[Tuple[Node, ua.DataValue]]" = asyncio.Queue()
+        self._update_task: Optional[asyncio.Task] = None
         self._data_store: Dict[str, LiveTag] = {}
-        self._node_map: Dict[ua.Node, str] = {}  # Maps asyncua.Node back to tag name
-        self._lock = asyncio.Lock()
-
-        logger.info(f"OpcuaClient initialized for server: {self.server_url}")
+        # Tuple of the data store's values; None when a tag changed since it was built
+        self._tags_snapshot: Optional[Tuple[LiveTag, ...]] = None
+        # API-ready representation of each tag, rebuilt only when a value changes
+        self._tag_payloads: Dict[str, Dict[str, Any]] = {}
+        # Bumped on every change, so a snapshot encoded across awaits can tell
+        # whether it is still current
+        self._payloads_version: int = 0
+        # Encoded `{"tags": ...}` document; None when a tag changed since it was built
+        self._snapshot_bytes: Optional[bytes] = None
+        self._columnar_snapshot_bytes: Optional[bytes] = None
+        # Snapshot encodes in progress, keyed by encoder; awaited by every reader
+        # that arrives before they finish
+        self._encode_tasks: Dict[Callable, "asyncio.Task[Tuple[int, bytes]]"] = {}
+        # Queues of JSON-encoded `TagBatchUpdate` messages, one per push subscriber
+        self._subscribers: Set["asyncio.Queue[Optional[str]]"] = set()
+        self._node_map: Dict[str, str] = {}  # Maps NodeId strings back to tag names
+        # Fast path for notifications: asyncua hands back the very Node objects
+        # passed to `subscribe_data_change`, so they can be matched by identity
+        # (an int hash) instead of through Node/NodeId `__hash__` and `__eq__`.
+        # The nodes are kept referenced here, so their ids can't be reused.
+        self._subscribed_nodes: Dict[int, Tuple[Node, str]] = {}
+        # Parsed Node objects by NodeId string, so reads/writes don't re-parse
+        self._node_cache: Dict[str, Node] = {}
+
+        logger.info("OpcuaClient initialized for server: %s", self.server_url)
         self._initialize_data_store()
 
     def _initialize_data_store(self):
         """Populates the data store with tags from config, setting initial null state."""
-        for group in settings.opc_tags:
-            for tag in group.tags:
-                self._data_store[tag.name] = LiveTag(
-                    name=tag.name,
-                    node_id=tag.node_id,
-                    value=None,
-                    status="Uncertain",
-                    timestamp=datetime.utcnow()
-                )
+        for tag in self._all_tag_configs:
+            # No `received_at`: it marks the placeholder as never updated.
+            live_tag = LiveTag(
+                name=tag.name,
+                node_id=tag.node_id,
+                value=None,
+                status=NO_DATA_STATUS_TEXT,
+            )
+            self._data_store[tag.name] = live_tag
+            self._tag_payloads[tag.name] = _tag_payload(live_tag, NO_DATA_STATUS_CODE, None)
 
     @property
     def is_connected(self) -> bool:
@@ -109,6 +412,9 @@ class OpcuaClient:
 
         logger.info("Starting OpcuaClient...")
         self._running = True
+        if not self.is_connected:
+            self._disconnect_event.set()
+        self._update_task = asyncio.create_task(self._process_updates())
         self._connection_task = asyncio.create_task(self._connection_manager())
 
     async def stop(self):
@@ -125,29 +431,122 @@ class OpcuaClient:
                 await self._connection_task
             except asyncio.CancelledError:
                 logger.info("Connection manager task cancelled.")
+        if self._update_task:
+            self._update_task.cancel()
+            try:
+                await self._update_task
+            except asyncio.CancelledError:
+                logger.info("Update processing task cancelled.")
         await self.disconnect()
 
     async def _connection_manager(self):
-        """A background task to manage the connection state."""
+        """
+        A background task to manage the connection state.
+
+        While connected it waits for `disconnect` or `connection_lost` to signal
+        a lost connection (see `_watch_session`), so by default it does no
+        periodic work at all.
+        """
         logger.info("Connection manager started.")
         while self._running:
+            await self._wait_for_connection_loss()
+            self._disconnect_event.clear()
+            if self.is_connected:
+                # The session was lost without `disconnect`; release it first.
+                await self.disconnect()
+                self._disconnect_event.clear()
+            try:
+                await self.connect()
+                await self._initialize_subscriptions()
+            except Exception as e:
+                logger.error("Connection failed: %s. Retrying in %ss...", e, RECONNECT_INTERVAL_SECONDS)
+                await self.disconnect()  # Ensure clean state
             if not self.is_connected:
-                try:
-                    await self.connect()
-                    await self._initialize_subscriptions()
-                except Exception as e:
-                    logger.error(f"Connection failed: {e}. Retrying in {RECONNECT_INTERVAL_SECONDS}s...")
-                    await self.disconnect()  # Ensure clean state
-            await asyncio.sleep(RECONNECT_INTERVAL_SECONDS)
+                # Covers subscription failures too, which disconnect on their own.
+                await asyncio.sleep(RECONNECT_INTERVAL_SECONDS)
+                self._disconnect_event.set()
         logger.info("Connection manager stopped.")
 
+    async def _wait_for_connection_loss(self):
+        """
+        Returns once the connection is gone or a connection attempt is due.
+
+        The lost-connection signals can't detect a half-open TCP connection
+        (e.g. a pulled cable), which only fails once the OS gives up on it. With
+        a keepalive interval configured, the server state is also read whenever
+        no signal arrives for that long, trading periodic network reads for
+        faster detection.
+        """
+        if self.keepalive_interval <= 0:
+            await self._disconnect_event.wait()
+            return
+        while True:
+            try:
+                async with asyncio.timeout(self.keepalive_interval):
+                    await self._disconnect_event.wait()
+                return
+            except TimeoutError:
+                pass
+            if self.is_connected and not await self._is_session_alive():
+                return
+
+    async def _is_session_alive(self) -> bool:
+        """Checks the session by reading the server state."""
+        try:
+            async with asyncio.timeout(KEEPALIVE_TIMEOUT_SECONDS):
+                await self.client.nodes.server_state.read_value()
+        except Exception as e:
+            logger.warning("Keepalive read failed: %s", e)
+            return False
+        return True
+
+    def connection_lost(self, reason: str):
+        """
+        Signals the connection manager that the session was lost.
+
+        Args:
+            reason: Why the session is considered lost, for the log.
+        """
+        if self.is_connected:
+            logger.warning("Connection to OPC UA server lost: %s", reason)
+            self._disconnect_event.set()
+
     async def connect(self):
         """Establishes a connection to the OPC UA server."""
-        logger.info(f"Attempting to connect to {self.server_url}...")
+        logger.info("Attempting to connect to %s...", self.server_url)
         await self.client.connect()
         self._is_connected = True
+        self._watch_session()
         logger.info("Successfully connected to OPC UA server.")
 
+    def _watch_session(self):
+        """
+        Hooks the new session's failure signals up to `connection_lost`.
+
+        asyncua 0.9.94 has no lost-connection callback, and a closed socket
+        doesn't fail the pending publish request, which just stays unanswered.
+        So the socket protocol's `connection_lost` is wrapped, and a failed
+        secure channel renewal counts as a lost session too. Subscription status
+        changes are reported through `SubscriptionHandler`.
+        """
+        protocol = self.client.uaclient.protocol
+        socket_closed = protocol.connection_lost
+
+        def on_socket_closed(exc: Optional[Exception]):
+            socket_closed(exc)
+            self.connection_lost(f"socket closed ({exc or 'by the server'})")
+
+        protocol.connection_lost = on_socket_closed
+
+        renew_task = getattr(self.client, "_renew_channel_task", None)
+        if renew_task is not None:
+            renew_task.add_done_callback(self._on_channel_renewal_done)
+
+    def _on_channel_renewal_done(self, task: asyncio.Task):
+        """Treats a failed secure channel renewal as a lost session."""
+        if not task.cancelled() and task.exception() is not None:
+            self.connection_lost(f"secure channel renewal failed ({task.exception()})")
+
     async def disconnect(self):
         """Disconnects from the OPC UA server."""
         if self.is_connected:
@@ -155,11 +554,15 @@ class OpcuaClient:
                 await self.client.disconnect()
                 logger.info("Successfully disconnected from OPC UA server.")
             except Exception as e:
-                logger.error(f"Error during disconnection: {e}")
+                logger.error("Error during disconnection: %s", e)
             finally:
                 self._is_connected = False
                 self.subscription = None
                 self._node_map = {}
+                self._subscribed_nodes = {}
+                self._node_cache = {}
+                # Rearms the connection manager
+                self._disconnect_event.set()
 
     async def _initialize_subscriptions(self):
         """Creates subscriptions for all configured tags."""
@@ -171,68 +574,307 @@ class OpcuaClient:
         try:
             self.subscription = await self.client.create_subscription(500, self.sub_handler)
             nodes_to_subscribe = []
-            tags_to_process: List[Tag] = [tag for group in settings.opc_tags for tag in group.tags]
-
-            for tag_config in tags_to_process:
+            for tag_config in self._all_tag_configs:
                 try:
-                    node = self.client.get_node(tag_config.node_id)
+                    node = self._node(tag_config.node_id)
                     nodes_to_subscribe.append(node)
-                    self._node_map[node] = tag_config.name
+                    self._node_map[node.nodeid.to_string()] = tag_config.name
+                    self._subscribed_nodes[id(node)] = (node, tag_config.name)
                 except ua.UaError as e:
-                    logger.error(f"Failed to get node for tag '{tag_config.name}' ({tag_config.node_id}): {e}")
+                    logger.error("Failed to get node for tag '%s' (%s): %s", tag_config.name, tag_config.node_id, e)
 
             if nodes_to_subscribe:
                 await self.subscription.subscribe_data_change(nodes_to_subscribe)
-                logger.info(f"Subscribed to {len(nodes_to_subscribe)} nodes.")
+                logger.info("Subscribed to %d nodes.", len(nodes_to_subscribe))
                 # Perform an initial read to populate data immediately
                 await self._populate_initial_data(nodes_to_subscribe)
 
         except Exception as e:
-            logger.error(f"Failed to create subscription: {e}")
+            logger.error("Failed to create subscription: %s", e)
             await self.disconnect()
 
-    async def _populate_initial_data(self, nodes: List[ua.Node]):
+    async def _populate_initial_data(self, nodes: List[Node]):
         """Performs an initial read of all subscribed nodes."""
         logger.info("Performing initial data read for all subscribed nodes.")
         try:
-            values = await self.client.read_values(nodes)
-            data_values = await self.client.read_data_values(nodes)
+            data_values = await self._read_data_values(nodes)
 
+            changed: Dict[str, LiveTag] = {}
             for i, node in enumerate(nodes):
-                await self.update_tag_value_from_node(node, data_values[i])
+                live_tag = self.update_tag_value_from_node(node, data_values[i])
+                if live_tag is not None:
+                    changed[live_tag.name] = live_tag
+            self._publish_updates(list(changed.values()))
 
         except Exception as e:
-            logger.error(f"Error during initial data population: {e}")
+            logger.error("Error during initial data population: %s", e)
 
-    async def update_tag_value_from_node(self, node: ua.Node, data_value: ua.DataValue):
-        """Updates the internal data store for a given tag based on a new DataValue."""
-        tag_name = self._node_map.get(node)
+    def enqueue_update(self, node: Node, data_value: ua.DataValue):
+        """
+        Queues a datachange notification to be applied by the update task.
+
+        Args:
+            node: The node that has changed.
+            data_value: The node's new DataValue.
+        """
+        self._update_queue.put_nowait((node, data_value))
+
+    async def _process_updates(self):
+        """
+        A background task that applies queued datachange notifications.
+
+        All notifications that are already queued when the task wakes up, which
+        typically means a whole publish cycle, are drained and applied in one
+        batch, and push subscribers receive the batch's changes as one message,
+        with only the latest update of each tag.
+        """
+        logger.info("Update processing started.")
+        while True:
+            batch = [await self._update_queue.get()]
+            while not self._update_queue.empty():
+                batch.append(self._update_queue.get_nowait())
+
+            # Only the last update of each tag in a batch is pushed
+            changed: Dict[str, LiveTag] = {}
+            for node, data_value in batch:
+                try:
+                    live_tag = self.update_tag_value_from_node(node, data_value)
+                except Exception as e:
+                    logger.error("Failed to apply update for node %s: %s", node, e)
+                    continue
+                if live_tag is not None:
+                    changed[live_tag.name] = live_tag
+            try:
+                self._publish_updates(list(changed.values()))
+            except Exception as e:
+                logger.error("Failed to publish %d tag updates: %s", len(changed), e)
+
+    def update_tag_value_from_node(self, node: Node, data_value: ua.DataValue) -> Optional[LiveTag]:
+        """
+        Updates the internal data store for a given tag based on a new DataValue.
+
+        This is the only writer of the tag state. It is synchronous, so it can't
+        await (see the class docstring), and applying an update allocates no
+        coroutine. Push subscribers are not notified here; callers pass
+        the changed tags of a whole batch to `_publish_updates`.
+
+        Returns:
+            The tag's new state, or None if the update was ignored.
+        """
+        subscribed = self._subscribed_nodes.get(id(node))
+        if subscribed is not None and subscribed[0] is node:
+            tag_name = subscribed[1]
+        else:
+            tag_name = self._node_map.get(node.nodeid.to_string())
         if not tag_name:
-            logger.warning(f"Received update for an unmapped node: {node}")
+            logger.warning("Received update for an unmapped node: %s", node)
+            return None
+
+        existing = self._data_store.get(tag_name)
+        if existing is None:
+            logger.warning("Received update for tag '%s' not in data store.", tag_name)
+            return None
+
+        value = data_value.Value.Value
+        status = status_name(data_value.StatusCode)
+        source_timestamp = data_value.SourceTimestamp
+        # Servers republish unchanged values (e.g. after a reconnect); those
+        # would only invalidate the snapshots and re-notify subscribers. The
+        # first update always applies, whatever the placeholder holds.
+        if (
+            existing.received_at is not None
+            and existing.value == value
+            and existing.status == status
+            and existing.timestamp == source_timestamp
+        ):
+            return None
+
+        # LiveTag is immutable: readers that already hold the previous instance
+        # keep a consistent view, and the dict assignment swaps it atomically.
+        live_tag = LiveTag(
+            name=existing.name,
+            node_id=existing.node_id,
+            value=value,
+            status=status,
+            timestamp=source_timestamp,
+            # A float is much cheaper to produce than `datetime.utcnow()`; it is
+            # only converted, by `source_epoch_ms`, if there is no source timestamp.
+            received_at=time(),
+        )
+        self._data_store[tag_name] = live_tag
+        self._tag_payloads[tag_name] = _tag_payload(
+            live_tag, data_value.StatusCode.value, data_value.ServerTimestamp
+        )
+        self._payloads_version += 1
+        self._tags_snapshot = None
+        self._snapshot_bytes = None
+        self._columnar_snapshot_bytes = None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updated tag '%s': Value=%s, Status=%s", tag_name, live_tag.value, live_tag.status)
+        return live_tag
+
+    def _publish_updates(self, live_tags: List[LiveTag]):
+        """
+        Pushes the new state of several tags to every subscriber queue.
+
+        Args:
+            live_tags: The tags changed by one batch of updates.
+        """
+        if not live_tags or not self._subscribers:
             return
+        # Encoded once, however many subscribers there are, in the shape of
+        # `TagBatchUpdate`. The fields are known, so orjson encodes them
+        # directly instead of going through the Pydantic models.
+        message = orjson.dumps(
+            {
+                "updates": [
+                    {
+                        "name": live_tag.name,
+                        "value": live_tag.value,
+                        # Epoch milliseconds, like the REST API
+                        "timestamp": source_epoch_ms(live_tag),
+                        "status": live_tag.status,
+                    }
+                    for live_tag in live_tags
+                ]
+            },
+            default=json_default,
+            option=JSON_OPTIONS,
+        ).decode()
+        lagging = []
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                lagging.append(queue)
+        for queue in lagging:
+            self._require_resync(queue)
 
-        async with self._lock:
-            if tag_name in self._data_store:
-                live_tag = self._data_store[tag_name]
-                live_tag.value = data_value.Value.Value
-                live_tag.status = data_value.StatusCode.name
-                live_tag.timestamp = data_value.SourceTimestamp or datetime.utcnow()
-                logger.debug(f"Updated tag '{tag_name}': Value={live_tag.value}, Status={live_tag.status}")
-            else:
-                logger.warning(f"Received update for tag '{tag_name}' not in data store.")
+    def _require_resync(self, queue: "asyncio.Queue[Optional[str]]"):
+        """
+        Drops a subscriber that has fallen behind.
+
+        Its pending messages are only diffs it can no longer apply in order, so
+        they are discarded and replaced with `RESYNC_REQUIRED`.
+
+        Args:
+            queue: The subscriber's queue.
+        """
+        logger.warning("Dropping a push subscriber that is not keeping up; it must resync.")
+        self._subscribers.discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(RESYNC_REQUIRED)
+
+    def subscribe(self) -> "asyncio.Queue[Optional[str]]":
+        """
+        Registers a push subscriber for tag value changes.
+
+        Returns:
+            A queue that receives a JSON-encoded `TagBatchUpdate` for every
+            subsequent batch of tag changes. It must be released with
+            `unsubscribe`. If the subscriber falls more than
+            `SUBSCRIBER_QUEUE_SIZE` messages behind, it is unsubscribed and
+            receives `RESYNC_REQUIRED`; its view can then only be restored
+            from the full snapshot.
+        """
+        queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue[Optional[str]]"):
+        """
+        Removes a push subscriber registered with `subscribe`.
 
-    async def get_all_tags(self) -> List[LiveTag]:
+        Args:
+            queue: The queue returned by `subscribe`.
+        """
+        self._subscribers.discard(queue)
+
+    def get_all_tags(self) -> Tuple[LiveTag, ...]:
+        """
+        Retrieves all monitored tags with their current data.
+
+        The tuple is built at most once per change and shared by every caller
+        until a tag changes again.
+
+        Returns:
+            A tuple of LiveTag objects.
+        """
+        # LiveTag instances are immutable, so handing them out is safe
+        if self._tags_snapshot is None:
+            self._tags_snapshot = tuple(self._data_store.values())
+        return self._tags_snapshot
+
+    async def _encode_snapshot(
+        self, encode: Callable[[Dict[str, Dict[str, Any]]], Awaitable[bytes]]
+    ) -> Tuple[int, bytes]:
         """
-        Retrieves a list of all monitored tags with their current data.
+        Encodes the current tag data, sharing the work between concurrent readers.
+
+        A reader that arrives while an encode with the same encoder is in
+        progress awaits that encode instead of starting its own, so however
+        many requests follow an invalidation, only one document is encoded at a
+        time per layout.
+
+        Args:
+            encode: `encode_tags` or `encode_tags_columnar`.
 
         Returns:
-            A list of LiveTag objects.
+            The `_payloads_version` the encode started at, and the document.
+        """
+        task = self._encode_tasks.get(encode)
+        if task is None:
+            task = asyncio.create_task(self._run_encode(encode))
+            self._encode_tasks[encode] = task
+        # Shielded, so a reader whose request is cancelled doesn't cancel the
+        # encode for the others.
+        return await asyncio.shield(task)
+
+    async def _run_encode(
+        self, encode: Callable[[Dict[str, Dict[str, Any]]], Awaitable[bytes]]
+    ) -> Tuple[int, bytes]:
+        """Runs one shared encode for `_encode_snapshot`."""
+        try:
+            version = self._payloads_version
+            return version, await encode(self._tag_payloads)
+        finally:
+            # Readers arriving from now on use the cache or start a fresh encode
+            del self._encode_tasks[encode]
+
+    async def get_snapshot_bytes(self) -> bytes:
+        """
+        Returns the JSON-encoded data of all monitored tags, as served by the API.
+
+        The document is encoded at most once per change: updates only invalidate
+        it, and the next read rebuilds it. Every read in between, however many
+        API requests there are, returns the same bytes. Reads that arrive while
+        it is being rebuilt wait for that encode and get its result.
+        """
+        if self._snapshot_bytes is None:
+            version, body = await self._encode_snapshot(encode_tags)
+            if version != self._payloads_version:
+                # A tag changed while encoding; the document is still consistent,
+                # but already outdated, so it isn't cached. The next read starts
+                # a fresh encode.
+                return body
+            self._snapshot_bytes = body
+        return self._snapshot_bytes
+
+    async def get_columnar_snapshot_bytes(self) -> bytes:
         """
-        async with self._lock:
-            # Return a copy to prevent mutation outside the client
-            return list(self._data_store.values())
+        Returns the data of all monitored tags in the column-oriented JSON layout.
 
-    async def get_tag_by_name(self, name: str) -> Optional[LiveTag]:
+        Cached, invalidated and shared in the same way as `get_snapshot_bytes`.
+        """
+        if self._columnar_snapshot_bytes is None:
+            version, body = await self._encode_snapshot(encode_tags_columnar)
+            if version != self._payloads_version:
+                return body
+            self._columnar_snapshot_bytes = body
+        return self._columnar_snapshot_bytes
+
+    def get_tag_by_name(self, name: str) -> Optional[LiveTag]:
         """
         Retrieves a single tag by its configured name.
 
@@ -242,9 +884,36 @@ class OpcuaClient:
         Returns:
             A LiveTag object if found, otherwise None.
         """
-        async with self._lock:
-            # Return a copy
-            return self._data_store.get(name)
+        return self._data_store.get(name)
+
+    def get_tag_payload(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a single tag's data as served by the API.
+
+        Args:
+            name: The unique name of the tag.
+
+        Returns:
+            The tag's `TagData` fields as a dict if found, otherwise None. The
+            dict is shared with the snapshot and must not be modified.
+        """
+        return self._tag_payloads.get(name)
+
+    def _node(self, node_id: str) -> Node:
+        """
+        Returns the Node for a NodeId string, parsing it only on first use.
+
+        Args:
+            node_id: The NodeId string.
+
+        Returns:
+            The cached asyncua Node.
+        """
+        node = self._node_cache.get(node_id)
+        if node is None:
+            node = self.client.get_node(node_id)
+            self._node_cache[node_id] = node
+        return node
 
     async def read_value(self, node_id: str) -> Any:
         """
@@ -259,13 +928,64 @@ class OpcuaClient:
         if not self.is_connected:
             raise ConnectionError("OPC UA client is not connected.")
         try:
-            node = self.client.get_node(node_id)
+            node = self._node(node_id)
             value = await node.read_value()
-            logger.info(f"Read value from {node_id}: {value}")
+            logger.info("Read value from %s: %s", node_id, value)
             return value
         except Exception as e:
-            logger.error(f"Failed to read value from {node_id}: {e}")
+            logger.error("Failed to read value from %s: %s", node_id, e)
+            raise
+
+    async def _read_data_values(self, nodes: List[Node]) -> List[ua.DataValue]:
+        """
+        Reads the Value attribute of several nodes in one OPC UA Read call.
+
+        Unlike `Client.read_values`, this keeps the whole DataValue, including
+        its status code and timestamps.
+
+        Args:
+            nodes: The nodes to read.
+
+        Returns:
+            The DataValues, in the same order as `nodes`.
+        """
+        return await self.client.uaclient.read_attributes(
+            [node.nodeid for node in nodes], ua.AttributeIds.Value
+        )
+
+    async def read_values(self, node_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Performs a one-off read of several nodes in a single request.
+
+        Args:
+            node_ids: The NodeId strings to read.
+
+        Returns:
+            The value and status of each node (see `data_value_payload`), in the
+            same order as `node_ids`.
+
+        Raises:
+            ConnectionError: If the client is not connected.
+            ValueError: If one of the NodeId strings is malformed.
+        """
+        if not self.is_connected:
+            raise ConnectionError("OPC UA client is not connected.")
+        nodes = []
+        for node_id in node_ids:
+            try:
+                # Not taken from `_node`: these ids come from API callers, and
+                # caching them would grow `_node_cache` without bound.
+                nodes.append(self.client.get_node(node_id))
+            except ua.UaStringParsingError as e:
+                raise ValueError(f"Invalid NodeId '{node_id}'.") from e
+        try:
+            # One OPC UA Read service call instead of one round-trip per node
+            data_values = await self._read_data_values(nodes)
+            logger.info("Read values from %d nodes.", len(node_ids))
+        except Exception as e:
+            logger.error("Failed to read values from %s: %s", node_ids, e)
             raise
+        return [data_value_payload(data_value) for data_value in data_values]
 
     async def write_value(self, node_id: str, value: Any, variant_type: ua.VariantType):
         """
@@ -279,15 +999,10 @@ class OpcuaClient:
         if not self.is_connected:
             raise ConnectionError("OPC UA client is not connected.")
         try:
-            node = self.client.get_node(node_id)
+            node = self._node(node_id)
             variant = ua.Variant(value, variant_type)
             await node.write_value(variant)
-            logger.info(f"Wrote value to {node_id}: {value}")
+            logger.info("Wrote value to %s: %s", node_id, value)
         except Exception as e:
-            logger.error(f"Failed to write value to {node_id}: {e}")
+            logger.error("Failed to write value to %s: %s", node_id, e)
             raise
-
-
-# --- Singleton Instance ---
-# This single instance will be imported and used by other modules (e.g., API).
-opcua_client = OpcuaClient()
\ No newline at end of file
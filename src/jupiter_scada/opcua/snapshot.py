@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Shared tag snapshot storage for Jupiter SCADA.
+
+When the OPC UA subscription runs in its own process (see `worker.py`), the
+HTTP workers don't hold an OPC UA session of their own. Instead, the worker
+periodically writes the current tag data as a JSON document to a snapshot
+file, and every HTTP worker serves the file's bytes as they are.
+
+The file is replaced atomically on each write, so readers always see either
+the previous or the new snapshot, never a partially written one.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from jupiter_scada.opcua.client import encode_tags_columnar
+
+# --- Constants ---
+# Served until the worker has published its first snapshot.
+EMPTY_SNAPSHOT = b'{"tags":{}}'
+
+# --- Logger ---
+logger = logging.getLogger(__name__)
+
+
+def write_snapshot(path: Path, body: bytes) -> None:
+    """
+    Atomically replaces the snapshot file with a new JSON body.
+
+    Args:
+        path: The snapshot file to write.
+        body: The encoded JSON document.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+
+
+class TagSnapshotReader:
+    """
+    Read-only tag source backed by a snapshot file written by the OPC UA worker.
+
+    It exposes the same snapshot accessors as `OpcuaClient`, so the API
+    endpoints can serve from either one. The file is only re-read when its
+    modification time changes.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initializes the snapshot reader.
+
+        Args:
+            path: The snapshot file written by the OPC UA worker.
+        """
+        self.path = path
+        self._mtime_ns: Optional[int] = None
+        self._snapshot_bytes: bytes = EMPTY_SNAPSHOT
+        # Decoded tag payloads and the snapshot they were decoded from
+        self._payloads_source: Optional[bytes] = None
+        self._tag_payloads: Dict[str, Dict[str, Any]] = {}
+        # Columnar document and the snapshot it was derived from
+        self._columnar_source: Optional[bytes] = None
+        self._columnar_snapshot_bytes: bytes = b""
+        logger.info("TagSnapshotReader initialized for: %s", self.path)
+
+    def _read_snapshot(self) -> bytes:
+        """
+        Returns the JSON-encoded data of all tags from the latest snapshot.
+
+        An empty tag listing is returned if the worker has not written a
+        snapshot yet.
+        """
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            logger.warning("Tag snapshot '%s' does not exist yet.", self.path)
+            return EMPTY_SNAPSHOT
+
+        if mtime_ns != self._mtime_ns:
+            with open(self.path, "rb") as f:
+                self._snapshot_bytes = f.read()
+            self._mtime_ns = mtime_ns
+        return self._snapshot_bytes
+
+    def _read_payloads(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the tag payloads of the latest snapshot, decoding it once per new snapshot."""
+        snapshot = self._read_snapshot()
+        if snapshot is not self._payloads_source:
+            self._tag_payloads = orjson.loads(snapshot)["tags"]
+            self._payloads_source = snapshot
+        return self._tag_payloads
+
+    async def get_snapshot_bytes(self) -> bytes:
+        """Returns the JSON-encoded data of all tags from the latest snapshot."""
+        return self._read_snapshot()
+
+    def get_tag_payload(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a single tag's data from the latest snapshot.
+
+        Args:
+            name: The unique name of the tag.
+
+        Returns:
+            The tag's `TagData` fields as a dict if found, otherwise None.
+        """
+        return self._read_payloads().get(name)
+
+    async def get_columnar_snapshot_bytes(self) -> bytes:
+        """
+        Returns the latest snapshot converted to the column-oriented JSON layout.
+
+        The worker only publishes the per-tag layout, so the conversion happens
+        here, once per new snapshot.
+        """
+        snapshot = self._read_snapshot()
+        if snapshot is not self._columnar_source:
+            body = await encode_tags_columnar(self._read_payloads())
+            self._columnar_snapshot_bytes = body
+            self._columnar_source = snapshot
+        return self._columnar_snapshot_bytes
+
+    async def read_values(self, node_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        One-off reads are not available from a snapshot.
+
+        Raises:
+            ConnectionError: Always, as this process has no OPC UA session.
+        """
+        raise ConnectionError("Live reads are not available; the OPC UA session is held by the worker process.")
+
+    def subscribe(self) -> None:
+        """
+        Push updates are not available from a snapshot.
+
+        Raises:
+            ConnectionError: Always, as updates are only received by the worker.
+        """
+        raise ConnectionError("Push updates are not available; the OPC UA session is held by the worker process.")
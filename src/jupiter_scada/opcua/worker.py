@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Standalone OPC UA subscription worker for Jupiter SCADA.
+
+Running the OPC UA client inside the web server means every additional
+Uvicorn worker opens its own session and duplicates every subscription.
+This entry point runs the client in a dedicated process instead and
+publishes the tag data to a shared snapshot file (see `snapshot.py`), which
+the HTTP workers only read from.
+
+Usage:
+    TAG_SNAPSHOT_PATH=/run/jupiter/tags.json python -m jupiter_scada.opcua.worker
+    TAG_SNAPSHOT_PATH=/run/jupiter/tags.json uvicorn jupiter_scada.api.server:app --workers 4
+
+An exclusive lock on `<snapshot>.lock` ensures only one worker subscribes
+at a time; a second instance exits immediately.
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from typing import IO, Optional
+
+from jupiter_scada.core.config import settings
+from jupiter_scada.opcua.client import OpcuaClient
+from jupiter_scada.opcua.snapshot import write_snapshot
+
+# --- Constants ---
+SNAPSHOT_WRITE_INTERVAL_SECONDS = 0.5
+
+# --- Logger ---
+logger = logging.getLogger(__name__)
+
+
+def _acquire_worker_lock(snapshot_path: Path) -> Optional[IO]:
+    """
+    Takes an exclusive, non-blocking lock next to the snapshot file.
+
+    Args:
+        snapshot_path: The snapshot file this worker will publish to.
+
+    Returns:
+        The open lock file, which must be kept open for as long as the lock is
+        held, or None if another worker already holds it.
+    """
+    lock_file = open(snapshot_path.with_name(f"{snapshot_path.name}.lock"), "w")
+    if sys.platform == "win32":
+        logger.warning("Worker locking is not supported on Windows; run a single worker only.")
+        return lock_file
+
+    import fcntl
+
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+async def publish_snapshots(client: OpcuaClient, snapshot_path: Path) -> None:
+    """
+    Writes the client's tag data to the snapshot file whenever it changes.
+
+    Args:
+        client: The running OpcuaClient to publish data from.
+        snapshot_path: The snapshot file to write.
+    """
+    last_body = b""
+    while True:
+        body = await client.get_snapshot_bytes()
+        # The client hands out the same bytes object until a tag changes.
+        if body is not last_body:
+            await asyncio.to_thread(write_snapshot, snapshot_path, body)
+            last_body = body
+        await asyncio.sleep(SNAPSHOT_WRITE_INTERVAL_SECONDS)
+
+
+async def main() -> None:
+    """Runs the OPC UA client and publishes its data until cancelled."""
+    snapshot_path = settings.tag_snapshot_path
+    if snapshot_path is None:
+        logger.critical("TAG_SNAPSHOT_PATH must be set to run the OPC UA worker.")
+        return
+
+    lock_file = _acquire_worker_lock(snapshot_path)
+    if lock_file is None:
+        logger.critical("Another OPC UA worker is already publishing to '%s'. Exiting.", snapshot_path)
+        return
+
+    logger.info("OPC UA worker publishing tag snapshots to '%s'.", snapshot_path)
+    opcua_client = OpcuaClient()
+    await opcua_client.start()
+    try:
+        await publish_snapshots(opcua_client, snapshot_path)
+    finally:
+        await opcua_client.stop()
+        lock_file.close()
+
+
+def run() -> None:
+    """Synchronous wrapper to start the worker's event loop."""
+    try:
+        asyncio.run(main())
+    except (KeyboardInterrupt, SystemExit):
+        logger.info("OPC UA worker shutdown initiated by user.")
+
+
+if __name__ == "__main__":
+    run()
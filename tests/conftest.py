@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Shared pytest configuration for the Jupiter SCADA test suite.
+
+The package lives in `src/` and imports itself as `jupiter_scada`, so that
+directory is put on `sys.path` before any test module is collected.
+It also provides an `OpcuaClient` fixture that needs no OPC UA server.
+"""
+
+import sys
+from pathlib import Path
+import pytest
+import yaml
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from jupiter_scada.models.opc import TagConfig  # noqa: E402 (needs SRC_DIR on sys.path)
+
+TEST_TAGS = [
+    TagConfig(name="Temperature", node_id="ns=2;i=1"),
+    TagConfig(name="Pressure", node_id="ns=2;i=2"),
+]
+
+
+@pytest.fixture
+def app_settings(tmp_path, monkeypatch):
+    """
+    Real `Settings` loaded from a `config.yaml` defining `TEST_TAGS`.
+
+    They replace the global settings in every module that reads them.
+    """
+    from jupiter_scada.api import server
+    from jupiter_scada.core.config import Settings
+    from jupiter_scada.opcua import client, worker
+
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "config.yaml").write_text(
+        yaml.safe_dump({"tags": [tag.model_dump() for tag in TEST_TAGS]}), encoding="utf-8"
+    )
+    monkeypatch.setenv("JUPITER_PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setenv("OPCUA_SERVER_URL", "opc.tcp://localhost:4840")
+    monkeypatch.delenv("TAG_SNAPSHOT_PATH", raising=False)
+
+    # A fresh instance, bypassing the singleton, so the real one stays unloaded
+    test_settings = object.__new__(Settings)
+    for module in (client, server, worker):
+        monkeypatch.setattr(module, "settings", test_settings)
+    return test_settings
+
+
+@pytest.fixture
+def opcua_client(app_settings):
+    """
+    An OpcuaClient configured with `TEST_TAGS`, never connected to a server.
+
+    Its node map is populated as if the tags had been subscribed, so updates can
+    be applied with `client.update_tag_value_from_node`.
+    """
+    from jupiter_scada.opcua.client import OpcuaClient
+
+    client = OpcuaClient()
+    client._node_map = {tag.node_id: tag.name for tag in TEST_TAGS}
+    return client
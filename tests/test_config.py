@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the lazily loaded application settings.
+"""
+
+import pytest
+
+from jupiter_scada.core.config import Settings
+
+
+def fresh_settings() -> Settings:
+    """Returns a new, unloaded Settings object, bypassing the singleton."""
+    return object.__new__(Settings)
+
+
+def test_settings_load_on_first_access(tmp_path, monkeypatch):
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "config.yaml").write_text(
+        "tags:\n  - name: Temperature\n    node_id: ns=2;i=1\n", encoding="utf-8"
+    )
+    monkeypatch.setenv("JUPITER_PROJECT_ROOT", str(tmp_path))
+    settings = fresh_settings()
+
+    assert settings.tags == [{"name": "Temperature", "node_id": "ns=2;i=1"}]
+    assert settings.project_root == tmp_path.resolve()
+
+
+def test_failed_load_is_reported_on_every_access(monkeypatch):
+    def broken_root(self):
+        raise FileNotFoundError("no project root")
+
+    monkeypatch.setattr(Settings, "_find_project_root", broken_root)
+    settings = fresh_settings()
+
+    for _ in range(2):
+        with pytest.raises(FileNotFoundError, match="no project root"):
+            settings.tags
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Behavior tests for the tag API endpoints.
+
+The router is mounted on a bare FastAPI app whose client dependency is
+overridden with an unconnected `OpcuaClient` (or a `TagSnapshotReader`), so
+the responses come from the real tag state and encoders.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from asyncua import ua
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from jupiter_scada.api.endpoints import get_opcua_client, router, stream_tag_updates
+from jupiter_scada.opcua.client import SUBSCRIBER_QUEUE_SIZE, OpcuaClient
+from jupiter_scada.opcua.snapshot import TagSnapshotReader
+
+from .test_opcua_client import SOURCE_TIME_MS, apply, make_data_value
+
+
+def wait_for_subscriber(websocket, client):
+    """Waits, on the app's event loop, until the WebSocket handler has subscribed."""
+
+    async def subscribed():
+        while not client._subscribers:
+            await asyncio.sleep(0)
+
+    websocket.portal.call(subscribed)
+
+
+def make_test_client(tag_source) -> TestClient:
+    """Returns a TestClient for the API router, serving from `tag_source`."""
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_opcua_client] = lambda: tag_source
+    return TestClient(app)
+
+
+@pytest.fixture
+def api(opcua_client) -> TestClient:
+    apply(opcua_client, "ns=2;i=1", make_data_value(21.5))
+    return make_test_client(opcua_client)
+
+
+# --- Snapshots ---
+
+
+def test_get_all_tags(api):
+    response = api.get("/api/tags")
+
+    assert response.status_code == 200
+    tags = response.json()["tags"]
+    assert list(tags) == ["Temperature", "Pressure"]
+    assert tags["Temperature"] == {
+        "value": 21.5,
+        "source_timestamp": SOURCE_TIME_MS,
+        "server_timestamp": SOURCE_TIME_MS,
+        "status_code": 0,
+        "status_text": "Good",
+    }
+    assert tags["Pressure"]["status_text"] == "BadWaitingForInitialData"
+
+
+def test_get_all_tags_encodes_bytes_values(opcua_client):
+    apply(opcua_client, "ns=2;i=2", make_data_value(b"\x00\xff"))
+    api = make_test_client(opcua_client)
+
+    assert api.get("/api/tags").json()["tags"]["Pressure"]["value"] == "AP8="
+    assert api.get("/api/tags", params={"layout": "columnar"}).json()["values"][1] == "AP8="
+
+
+def test_get_all_tags_columnar(api):
+    body = api.get("/api/tags", params={"layout": "columnar"}).json()
+
+    assert body["names"] == ["Temperature", "Pressure"]
+    assert body["values"] == [21.5, None]
+    assert body["source_timestamps"] == [SOURCE_TIME_MS, None]
+    assert body["status_codes"][0] == 0
+    assert body["status_texts"] == ["Good", "BadWaitingForInitialData"]
+
+
+def test_a_tag_named_columnar_is_not_shadowed(app_settings, monkeypatch):
+    monkeypatch.setattr(app_settings, "tags", [{"name": "columnar", "node_id": "ns=2;i=1"}])
+    api = make_test_client(OpcuaClient())
+
+    assert api.get("/api/tags/columnar").json()["status_text"] == "BadWaitingForInitialData"
+
+
+def test_a_tag_named_ws_is_not_shadowed(app_settings, monkeypatch):
+    monkeypatch.setattr(app_settings, "tags", [{"name": "ws", "node_id": "ns=2;i=1"}])
+    api = make_test_client(OpcuaClient())
+
+    assert api.get("/api/tags/ws").json()["status_text"] == "BadWaitingForInitialData"
+
+
+def test_get_tag_by_name(api):
+    response = api.get("/api/tags/Temperature")
+
+    assert response.status_code == 200
+    assert response.json()["value"] == 21.5
+
+
+def test_get_unknown_tag_returns_404(api):
+    assert api.get("/api/tags/Unknown").status_code == 404
+
+
+# --- Ad-hoc reads ---
+
+
+def test_read_values_requires_a_connection(api):
+    assert api.get("/api/nodes/values", params={"ids": "ns=2;i=1"}).status_code == 503
+
+
+def test_read_values_rejects_malformed_ids(opcua_client):
+    opcua_client._is_connected = True
+    api = make_test_client(opcua_client)
+
+    response = api.get("/api/nodes/values", params={"ids": "not a node id"})
+
+    assert response.status_code == 400
+
+
+def test_read_values_returns_value_and_status(opcua_client, monkeypatch):
+    opcua_client._is_connected = True
+
+    async def read_attributes(nodeids, attribute):
+        return [
+            make_data_value(1.5),
+            ua.DataValue(StatusCode_=ua.StatusCode(ua.StatusCodes.BadNodeIdUnknown)),
+        ]
+
+    monkeypatch.setattr(opcua_client.client, "uaclient", SimpleNamespace(read_attributes=read_attributes))
+    api = make_test_client(opcua_client)
+
+    body = api.get("/api/nodes/values", params=[("ids", "ns=2;i=1"), ("ids", "ns=2;i=9")]).json()
+
+    assert body["ns=2;i=1"]["value"] == 1.5
+    assert body["ns=2;i=1"]["status_text"] == "Good"
+    assert body["ns=2;i=9"]["value"] is None
+    assert body["ns=2;i=9"]["status_text"] == "BadNodeIdUnknown"
+    # Parsed per request, not kept in the subscription's node cache
+    assert opcua_client._node_cache == {}
+
+
+def test_a_tag_named_values_is_not_shadowed(app_settings, monkeypatch):
+    monkeypatch.setattr(app_settings, "tags", [{"name": "values", "node_id": "ns=2;i=1"}])
+    api = make_test_client(OpcuaClient())
+
+    response = api.get("/api/tags/values")
+
+    assert response.status_code == 200
+    assert response.json()["status_text"] == "BadWaitingForInitialData"
+
+
+# --- Push updates ---
+
+
+def test_websocket_streams_updates(opcua_client):
+    api = make_test_client(opcua_client)
+
+    with api.websocket_connect("/api/ws/tags") as websocket:
+        wait_for_subscriber(websocket, opcua_client)
+        live_tag = apply(opcua_client, "ns=2;i=1", make_data_value(22.0))
+        # Queues are not thread-safe, so updates are published on the app's loop
+        websocket.portal.call(opcua_client._publish_updates, [live_tag])
+
+        message = orjson.loads(websocket.receive_text())
+
+    assert message == {
+        "updates": [{"name": "Temperature", "value": 22.0, "timestamp": SOURCE_TIME_MS, "status": "Good"}]
+    }
+
+
+def test_websocket_closes_lagging_subscribers(opcua_client):
+    api = make_test_client(opcua_client)
+
+    with api.websocket_connect("/api/ws/tags") as websocket:
+        wait_for_subscriber(websocket, opcua_client)
+        live_tag = apply(opcua_client, "ns=2;i=1", make_data_value(22.0))
+
+        def flood():
+            # Published without yielding, so the handler can't drain the queue
+            for _ in range(SUBSCRIBER_QUEUE_SIZE + 1):
+                opcua_client._publish_updates([live_tag])
+
+        websocket.portal.call(flood)
+
+        with pytest.raises(WebSocketDisconnect) as excinfo:
+            websocket.receive_text()
+
+    assert excinfo.value.code == 1013
+    assert not opcua_client._subscribers
+
+
+def test_websocket_client_disconnect_unsubscribes(opcua_client):
+    api = make_test_client(opcua_client)
+
+    with api.websocket_connect("/api/ws/tags") as websocket:
+        wait_for_subscriber(websocket, opcua_client)
+        websocket.close()
+
+        async def unsubscribed():
+            while opcua_client._subscribers:
+                await asyncio.sleep(0)
+
+        # No update is published: the disconnect alone releases the queue
+        websocket.portal.call(asyncio.wait_for, unsubscribed(), 1)
+
+
+@pytest.mark.asyncio
+async def test_websocket_send_failure_counts_as_disconnect(opcua_client):
+    class BrokenWebSocket:
+        """Accepts, then fails every send like a dropped connection."""
+
+        async def accept(self):
+            pass
+
+        async def receive(self):
+            await asyncio.Event().wait()
+
+        async def send_text(self, message):
+            raise OSError("connection reset")
+
+    task = asyncio.create_task(stream_tag_updates(BrokenWebSocket(), opcua_client))
+    while not opcua_client._subscribers:
+        await asyncio.sleep(0)
+    opcua_client._publish_updates([apply(opcua_client, "ns=2;i=1", make_data_value(22.0))])
+
+    await asyncio.wait_for(task, 1)
+    assert not opcua_client._subscribers
+
+
+def test_websocket_is_refused_by_a_snapshot_reader(tmp_path):
+    api = make_test_client(TagSnapshotReader(tmp_path / "tags.json"))
+
+    with api.websocket_connect("/api/ws/tags") as websocket:
+        with pytest.raises(WebSocketDisconnect) as excinfo:
+            websocket.receive_text()
+
+    assert excinfo.value.code == 1013
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the application entry point.
+"""
+
+from jupiter_scada import main
+from jupiter_scada.api.server import app
+
+
+def test_server_config_serves_the_app(app_settings, monkeypatch):
+    monkeypatch.setattr(main, "settings", app_settings)
+    monkeypatch.setenv("API_HOST", "0.0.0.0")
+    monkeypatch.setenv("API_PORT", "8123")
+
+    config = main.build_server_config()
+
+    assert config.app is app
+    assert (config.host, config.port) == ("0.0.0.0", 8123)
+    assert config.http == "httptools"
+    assert config.loop == "auto"
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the OPC UA client's tag state and encoding.
+
+These cover how DataValues are applied to the data store, how changes are
+batched and pushed to subscribers, and how snapshots are encoded. No OPC UA
+server is involved; see the `opcua_client` fixture in `conftest.py`.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+from asyncua import ua
+
+from jupiter_scada.opcua import client as client_module
+from jupiter_scada.opcua.client import (
+    NO_DATA_STATUS_CODE,
+    RESYNC_REQUIRED,
+    SUBSCRIBER_QUEUE_SIZE,
+    encode_tags,
+    encode_tags_columnar,
+    json_default,
+    status_name,
+    to_epoch_ms,
+)
+
+# asyncua reports naive datetimes in UTC
+SOURCE_TIME = datetime(2023, 10, 27, 10, 0, 0)
+SOURCE_TIME_MS = 1698400800000
+
+
+def make_data_value(value, status_code=ua.StatusCodes.Good, source_timestamp=SOURCE_TIME):
+    """Builds a DataValue as reported by a subscription."""
+    return ua.DataValue(
+        ua.Variant(value),
+        StatusCode_=ua.StatusCode(status_code),
+        SourceTimestamp=source_timestamp,
+        ServerTimestamp=source_timestamp,
+    )
+
+
+def apply(client, node_id, data_value):
+    """Applies one update through the client's single writer."""
+    return client.update_tag_value_from_node(client.client.get_node(node_id), data_value)
+
+
+# --- Helpers ---
+
+
+def test_to_epoch_ms_treats_naive_datetimes_as_utc():
+    assert to_epoch_ms(SOURCE_TIME) == SOURCE_TIME_MS
+    assert to_epoch_ms(SOURCE_TIME.replace(tzinfo=timezone.utc)) == SOURCE_TIME_MS
+    assert to_epoch_ms(None) is None
+
+
+def test_status_name_caches_codes_missing_from_the_table():
+    # Good with the "overflow" info bits set isn't in the precomputed table
+    code = ua.StatusCodes.Good | 0x480
+    assert code not in client_module._STATUS_NAMES
+
+    name = status_name(ua.StatusCode(code))
+
+    assert name == ua.StatusCode(code).name
+    assert client_module._STATUS_NAMES[code] is name
+    assert status_name(ua.StatusCode(code)) is name
+
+
+def test_json_default_encodes_bytes_as_base64():
+    body = orjson.dumps({"raw": b"\x00\xff"}, default=json_default)
+    assert orjson.loads(body) == {"raw": "AP8="}
+
+
+# --- Applying updates ---
+
+
+def test_initial_state_reports_no_data(opcua_client):
+    live_tag = opcua_client.get_tag_by_name("Temperature")
+    payload = opcua_client.get_tag_payload("Temperature")
+
+    assert live_tag.received_at is None
+    assert live_tag.status == payload["status_text"] == status_name(ua.StatusCode(NO_DATA_STATUS_CODE))
+    assert payload["status_code"] == NO_DATA_STATUS_CODE
+    assert payload["value"] is None
+
+
+def test_update_sets_tag_and_payload(opcua_client):
+    live_tag = apply(opcua_client, "ns=2;i=1", make_data_value(21.5))
+
+    assert live_tag is opcua_client.get_tag_by_name("Temperature")
+    assert live_tag.value == 21.5
+    assert live_tag.status == "Good"
+    assert opcua_client.get_tag_payload("Temperature") == {
+        "value": 21.5,
+        "source_timestamp": SOURCE_TIME_MS,
+        "server_timestamp": SOURCE_TIME_MS,
+        "status_code": 0,
+        "status_text": "Good",
+    }
+
+
+def test_receive_time_stands_in_for_a_missing_source_timestamp(opcua_client, monkeypatch):
+    monkeypatch.setattr(client_module, "time", lambda: SOURCE_TIME_MS / 1000)
+    queue = opcua_client.subscribe()
+
+    live_tag = apply(opcua_client, "ns=2;i=1", make_data_value(21.5, source_timestamp=None))
+    opcua_client._publish_updates([live_tag])
+
+    assert opcua_client.get_tag_payload("Temperature")["source_timestamp"] == SOURCE_TIME_MS
+    assert orjson.loads(queue.get_nowait())["updates"][0]["timestamp"] == SOURCE_TIME_MS
+
+
+def test_first_update_applies_even_if_it_matches_the_placeholder(opcua_client):
+    data_value = make_data_value(None, NO_DATA_STATUS_CODE, source_timestamp=None)
+    assert apply(opcua_client, "ns=2;i=1", data_value) is not None
+
+
+def test_unchanged_update_is_ignored(opcua_client):
+    apply(opcua_client, "ns=2;i=1", make_data_value(21.5))
+    version = opcua_client._payloads_version
+
+    assert apply(opcua_client, "ns=2;i=1", make_data_value(21.5)) is None
+    assert opcua_client._payloads_version == version
+
+
+def test_update_for_unmapped_node_is_ignored(opcua_client):
+    assert apply(opcua_client, "ns=2;i=99", make_data_value(1)) is None
+
+
+# --- Batching and push updates ---
+
+
+@pytest.mark.asyncio
+async def test_batch_is_pushed_as_one_message_with_the_last_value_per_tag(opcua_client):
+    queue = opcua_client.subscribe()
+    task = asyncio.create_task(opcua_client._process_updates())
+    try:
+        for value in (1.0, 2.0, 3.0):
+            opcua_client.enqueue_update(opcua_client.client.get_node("ns=2;i=1"), make_data_value(value))
+        opcua_client.enqueue_update(opcua_client.client.get_node("ns=2;i=2"), make_data_value(7))
+
+        message = orjson.loads(await asyncio.wait_for(queue.get(), 1))
+    finally:
+        task.cancel()
+
+    assert message == {
+        "updates": [
+            {"name": "Temperature", "value": 3.0, "timestamp": SOURCE_TIME_MS, "status": "Good"},
+            {"name": "Pressure", "value": 7, "timestamp": SOURCE_TIME_MS, "status": "Good"},
+        ]
+    }
+    assert queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_update_task_survives_a_publish_error(opcua_client, monkeypatch):
+    queue = opcua_client.subscribe()
+    publish = opcua_client._publish_updates
+    calls = []
+
+    def flaky_publish(live_tags):
+        calls.append(live_tags)
+        if len(calls) == 1:
+            raise ValueError("boom")
+        publish(live_tags)
+
+    monkeypatch.setattr(opcua_client, "_publish_updates", flaky_publish)
+    task = asyncio.create_task(opcua_client._process_updates())
+    try:
+        node = opcua_client.client.get_node("ns=2;i=1")
+        opcua_client.enqueue_update(node, make_data_value(1.0))
+        await asyncio.sleep(0)
+        opcua_client.enqueue_update(node, make_data_value(2.0))
+
+        message = orjson.loads(await asyncio.wait_for(queue.get(), 1))
+        assert not task.done()
+    finally:
+        task.cancel()
+
+    assert len(calls) == 2
+    assert message["updates"][0]["value"] == 2.0
+
+
+def test_lagging_subscriber_is_dropped_and_told_to_resync(opcua_client):
+    queue = opcua_client.subscribe()
+    live_tag = apply(opcua_client, "ns=2;i=1", make_data_value(1.0))
+
+    for _ in range(SUBSCRIBER_QUEUE_SIZE + 1):
+        opcua_client._publish_updates([live_tag])
+
+    assert queue.get_nowait() is RESYNC_REQUIRED
+    assert queue.empty()
+    assert queue not in opcua_client._subscribers
+
+
+# --- Snapshots ---
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_cached_until_a_tag_changes(opcua_client):
+    first = await opcua_client.get_snapshot_bytes()
+    assert await opcua_client.get_snapshot_bytes() is first
+
+    apply(opcua_client, "ns=2;i=1", make_data_value(21.5))
+    second = await opcua_client.get_snapshot_bytes()
+
+    assert second is not first
+    assert orjson.loads(second)["tags"]["Temperature"]["value"] == 21.5
+
+
+def count_encodes(monkeypatch, during_encode=None):
+    """Wraps `encode_tags` so it yields mid-encode; returns the list of calls."""
+    calls = []
+
+    async def slow_encode(tag_payloads):
+        calls.append(tag_payloads)
+        body = await encode_tags(tag_payloads)
+        await asyncio.sleep(0)
+        if during_encode is not None and len(calls) == 1:
+            during_encode()
+        return body
+
+    monkeypatch.setattr(client_module, "encode_tags", slow_encode)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_snapshot_reads_share_one_encode(opcua_client, monkeypatch):
+    calls = count_encodes(monkeypatch)
+
+    bodies = await asyncio.gather(*(opcua_client.get_snapshot_bytes() for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(body is bodies[0] for body in bodies)
+    assert await opcua_client.get_snapshot_bytes() is bodies[0]
+    assert not opcua_client._encode_tasks
+
+
+@pytest.mark.asyncio
+async def test_snapshot_outdated_mid_encode_is_returned_but_not_cached(opcua_client, monkeypatch):
+    calls = count_encodes(
+        monkeypatch, lambda: apply(opcua_client, "ns=2;i=1", make_data_value(21.5))
+    )
+
+    stale = await asyncio.gather(*(opcua_client.get_snapshot_bytes() for _ in range(3)))
+    assert len(calls) == 1
+    assert orjson.loads(stale[0])["tags"]["Temperature"]["value"] is None
+
+    current = await opcua_client.get_snapshot_bytes()
+    assert len(calls) == 2
+    assert orjson.loads(current)["tags"]["Temperature"]["value"] == 21.5
+    assert await opcua_client.get_snapshot_bytes() is current
+
+
+@pytest.mark.asyncio
+async def test_encoders_match_plain_orjson_across_chunks(monkeypatch):
+    monkeypatch.setattr(client_module, "ENCODE_CHUNK_TAGS", 3)
+    payloads = {
+        f"Tag{i}": {
+            "value": i if i % 2 else b"raw",
+            "source_timestamp": SOURCE_TIME_MS + i,
+            "server_timestamp": None,
+            "status_code": 0,
+            "status_text": "Good",
+        }
+        for i in range(10)
+    }
+    plain = orjson.loads(orjson.dumps({"tags": payloads}, default=json_default))
+
+    assert orjson.loads(await encode_tags(payloads)) == plain
+
+    columnar = orjson.loads(await encode_tags_columnar(payloads))
+    assert columnar["names"] == list(payloads)
+    assert columnar["values"] == [plain["tags"][name]["value"] for name in payloads]
+    assert columnar["source_timestamps"] == [SOURCE_TIME_MS + i for i in range(10)]
+    assert columnar["status_texts"] == ["Good"] * 10
+
+
+@pytest.mark.asyncio
+async def test_empty_tag_set_encodes():
+    assert orjson.loads(await encode_tags({})) == {"tags": {}}
+    assert orjson.loads(await encode_tags_columnar({}))["names"] == []
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Integration tests for the OPC UA session lifecycle.
+
+These run an in-process asyncua server, so the client's lost-connection
+detection and reconnects are exercised against a real socket and session.
+"""
+
+import asyncio
+import logging
+import socket
+
+import pytest
+from asyncua import Server
+
+from jupiter_scada.opcua import client as client_module
+from jupiter_scada.opcua.client import OpcuaClient
+
+pytestmark = pytest.mark.asyncio
+
+
+def free_port() -> int:
+    """Returns a local TCP port that is currently unused."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def start_server(url: str) -> Server:
+    """Starts a server exposing the `ns=2;i=1` node the first test tag maps to."""
+    server = Server()
+    await server.init()
+    server.set_endpoint(url)
+    namespace = await server.register_namespace("urn:jupiter-scada:tests")
+    await server.nodes.objects.add_variable(namespace, "Temperature", 21.5)
+    await server.start()
+    return server
+
+
+async def wait_until(condition, timeout: float = 5):
+    """Polls `condition` until it holds, failing after `timeout` seconds."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.02)
+
+
+async def test_client_reconnects_after_the_server_closes_the_session(app_settings, monkeypatch):
+    logging.getLogger("asyncua").setLevel(logging.ERROR)
+    url = f"opc.tcp://127.0.0.1:{free_port()}/"
+    monkeypatch.setenv("OPCUA_SERVER_URL", url)
+    monkeypatch.setattr(client_module, "RECONNECT_INTERVAL_SECONDS", 0.1)
+
+    server = await start_server(url)
+    client = OpcuaClient()
+    await client.start()
+    try:
+        await wait_until(lambda: client.get_tag_by_name("Temperature").value == 21.5)
+
+        await server.stop()
+        # Detected from the closed socket, without any keepalive reads
+        await wait_until(lambda: not client.is_connected, timeout=1)
+
+        server = await start_server(url)
+        await wait_until(lambda: client.is_connected and client.subscription is not None)
+    finally:
+        await client.stop()
+        await server.stop()
+
+
+async def test_failed_channel_renewal_counts_as_a_lost_session(opcua_client):
+    async def failed_renewal():
+        raise ConnectionError("renewal failed")
+
+    opcua_client._is_connected = True
+    task = asyncio.ensure_future(failed_renewal())
+    task.add_done_callback(opcua_client._on_channel_renewal_done)
+    with pytest.raises(ConnectionError):
+        await task
+    await asyncio.sleep(0)
+
+    assert opcua_client._disconnect_event.is_set()
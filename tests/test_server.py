@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Startup tests for the FastAPI application.
+
+These run the real lifespan against a `config.yaml` (see the `app_settings`
+fixture). No OPC UA server is running, so the client keeps retrying in the
+background while the API serves the configured tags without data.
+"""
+
+from fastapi.testclient import TestClient
+
+from jupiter_scada.api.server import TEMPLATES_DIR, app
+from jupiter_scada.opcua.client import OpcuaClient
+from jupiter_scada.opcua.snapshot import TagSnapshotReader
+
+
+def test_lifespan_starts_the_opcua_client(app_settings):
+    with TestClient(app) as api:
+        assert isinstance(app.state.opcua_client, OpcuaClient)
+        tags = api.get("/api/tags").json()["tags"]
+
+    assert list(tags) == ["Temperature", "Pressure"]
+    assert tags["Temperature"]["status_text"] == "BadWaitingForInitialData"
+
+
+def test_root_serves_the_frontend_or_points_at_the_api():
+    # Not entered as a context manager, so the lifespan (and the client) don't start
+    response = TestClient(app).get("/")
+
+    assert response.status_code == 200
+    if TEMPLATES_DIR.is_dir():
+        assert "text/html" in response.headers["content-type"]
+    else:
+        assert response.json()["api_docs"] == "/api/docs"
+
+
+def test_api_routes_are_served_under_a_single_prefix():
+    paths = {route.path for route in app.routes}
+
+    assert {"/api/tags", "/api/ws/tags", "/api/tags/{tag_name}", "/api/nodes/values"} <= paths
+    assert not any(path.startswith("/api/api/") for path in paths)
+
+
+def test_lifespan_reads_snapshots_when_a_worker_owns_the_session(app_settings, tmp_path, monkeypatch):
+    monkeypatch.setenv("TAG_SNAPSHOT_PATH", str(tmp_path / "tags.json"))
+
+    with TestClient(app) as api:
+        assert isinstance(app.state.opcua_client, TagSnapshotReader)
+        assert api.get("/api/tags").json() == {"tags": {}}
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the shared tag snapshot file and the OPC UA worker that writes it.
+"""
+
+import asyncio
+import contextlib
+import os
+import sys
+
+import orjson
+import pytest
+
+from jupiter_scada.opcua.snapshot import EMPTY_SNAPSHOT, TagSnapshotReader, write_snapshot
+from jupiter_scada.opcua import worker
+from jupiter_scada.opcua.worker import _acquire_worker_lock
+
+TAG_PAYLOAD = {
+    "value": 21.5,
+    "source_timestamp": 1698400800000,
+    "server_timestamp": None,
+    "status_code": 0,
+    "status_text": "Good",
+}
+
+
+def publish(path, tags):
+    """Writes a snapshot and gives it a new mtime, as a later write would have."""
+    write_snapshot(path, orjson.dumps({"tags": tags}))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_write_snapshot_replaces_the_file(tmp_path):
+    path = tmp_path / "tags.json"
+
+    write_snapshot(path, b"first")
+    write_snapshot(path, b"second")
+
+    assert path.read_bytes() == b"second"
+    assert [p.name for p in tmp_path.iterdir()] == ["tags.json"]
+
+
+@pytest.mark.asyncio
+async def test_reader_serves_an_empty_listing_until_the_first_snapshot(tmp_path):
+    reader = TagSnapshotReader(tmp_path / "tags.json")
+
+    assert await reader.get_snapshot_bytes() == EMPTY_SNAPSHOT
+    assert reader.get_tag_payload("Temperature") is None
+
+
+@pytest.mark.asyncio
+async def test_reader_follows_new_snapshots(tmp_path):
+    path = tmp_path / "tags.json"
+    reader = TagSnapshotReader(path)
+
+    publish(path, {"Temperature": TAG_PAYLOAD})
+    first = await reader.get_snapshot_bytes()
+    assert await reader.get_snapshot_bytes() is first
+    assert reader.get_tag_payload("Temperature") == TAG_PAYLOAD
+
+    publish(path, {"Temperature": {**TAG_PAYLOAD, "value": 22.0}})
+
+    assert orjson.loads(await reader.get_snapshot_bytes())["tags"]["Temperature"]["value"] == 22.0
+    assert reader.get_tag_payload("Temperature")["value"] == 22.0
+
+
+@pytest.mark.asyncio
+async def test_reader_converts_snapshots_to_columnar_once(tmp_path):
+    path = tmp_path / "tags.json"
+    reader = TagSnapshotReader(path)
+    publish(path, {"Temperature": TAG_PAYLOAD})
+
+    first = await reader.get_columnar_snapshot_bytes()
+
+    assert orjson.loads(first)["names"] == ["Temperature"]
+    assert await reader.get_columnar_snapshot_bytes() is first
+
+
+@pytest.mark.asyncio
+async def test_reader_has_no_live_session(tmp_path):
+    reader = TagSnapshotReader(tmp_path / "tags.json")
+
+    with pytest.raises(ConnectionError):
+        await reader.read_values(["ns=2;i=1"])
+    with pytest.raises(ConnectionError):
+        reader.subscribe()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="The worker lock uses flock.")
+def test_only_one_worker_holds_the_lock(tmp_path):
+    path = tmp_path / "tags.json"
+
+    lock_file = _acquire_worker_lock(path)
+    assert lock_file is not None
+    try:
+        assert _acquire_worker_lock(path) is None
+    finally:
+        lock_file.close()
+
+    second = _acquire_worker_lock(path)
+    assert second is not None
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_publishes_snapshots(app_settings, tmp_path, monkeypatch):
+    path = tmp_path / "tags.json"
+    monkeypatch.setenv("TAG_SNAPSHOT_PATH", str(path))
+    monkeypatch.setattr(worker, "SNAPSHOT_WRITE_INTERVAL_SECONDS", 0.01)
+
+    task = asyncio.create_task(worker.main())
+    try:
+        for _ in range(200):
+            if path.exists():
+                break
+            await asyncio.sleep(0.01)
+        assert not task.done()
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    tags = orjson.loads(path.read_bytes())["tags"]
+    assert list(tags) == ["Temperature", "Pressure"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="The worker lock uses flock.")
+@pytest.mark.asyncio
+async def test_second_worker_exits(app_settings, tmp_path, monkeypatch):
+    path = tmp_path / "tags.json"
+    monkeypatch.setenv("TAG_SNAPSHOT_PATH", str(path))
+    lock_file = _acquire_worker_lock(path)
+    try:
+        await asyncio.wait_for(worker.main(), 1)
+    finally:
+        lock_file.close()
+
+    assert not path.exists()